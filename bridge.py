@@ -14,32 +14,77 @@
 #  but never depend on each other."
 
 from __future__ import annotations
+import array
 import asyncio
+import hashlib
+import importlib.util
+import shelve
+import time
+import zlib
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterable, List
 from dataclasses import dataclass, field
 
-# CLOUD import with silent fallback
+import numpy as np
+
+# CLOUD availability probe (imported lazily in create())
 try:
-    from cloud import Cloud, CloudResponse, AsyncCloud
-    HAS_CLOUD = True
+    HAS_CLOUD = importlib.util.find_spec("cloud.cloud") is not None
 except ImportError:
     HAS_CLOUD = False
-    Cloud = None
-    CloudResponse = None
-    AsyncCloud = None
 
 # HAZE import with silent fallback
 try:
     from haze.async_haze import AsyncHazeField, HazeResponse
+    from haze._compat import DATACLASS_SLOTS
     HAS_HAZE = True
 except ImportError:
     HAS_HAZE = False
     AsyncHazeField = None
     HazeResponse = None
+    DATACLASS_SLOTS = {}
+
+
+# asyncio.timeout() cancels deterministically; wait_for is the pre-3.11 fallback
+_HAS_ASYNC_TIMEOUT = hasattr(asyncio, "timeout")
+
+# Slots in AsyncBridge._counters
+_SUCCESSES, _FAILURES, _TIMEOUTS = 0, 1, 2
+
+# Semantic cache embedding width (hashed character trigrams)
+_EMBED_DIM = 256
+
+
+def _normalize_input(text: str) -> str:
+    """Lowercase and collapse whitespace (exact-match cache key)."""
+    return " ".join(text.lower().split())
+
+
+def _disk_key(normalized: str) -> str:
+    """Stable on-disk cache key for a normalized input."""
+    return hashlib.blake2b(normalized.encode("utf-8"), digest_size=8).hexdigest()
+
+
+def _embed_input(normalized: str) -> np.ndarray:
+    """
+    Cheap hashed character-trigram embedding of a normalized input.
+    
+    Unit length, so a dot product between two embeddings is their
+    cosine similarity. crc32 keeps buckets stable across processes.
+    """
+    vec = np.zeros(_EMBED_DIM, dtype=np.float32)
+    padded = f"  {normalized} "
+    for i in range(len(padded) - 2):
+        vec[zlib.crc32(padded[i:i + 3].encode("utf-8")) % _EMBED_DIM] += 1.0
+    norm = float(np.linalg.norm(vec))
+    if norm > 0:
+        vec /= norm
+    return vec
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class BridgeResponse:
     """
     Response from the HAZE ↔ CLOUD bridge.
@@ -87,16 +132,61 @@ class AsyncBridge:
         cloud: Optional[AsyncCloud] = None,
         cloud_timeout: float = 0.5,  # Fast timeout for responsiveness
         silent_fallback: bool = True,  # No error messages on CLOUD failure
+        cache_size: int = 0,  # CLOUD response cache entries (0 disables)
+        cache_threshold: Optional[float] = None,  # Cosine for near-duplicate hits (None = exact only)
+        batch_window: float = 0.005,  # Seconds to collect concurrent pings
+        max_batch: int = 16,  # Max inputs per CLOUD batch (1 disables)
+        cache_path: Optional[Path] = None,  # On-disk CLOUD cache (None disables)
+        cache_ttl: float = 86400.0,  # Seconds before a disk entry is stale
     ):
         self.haze = haze
         self.cloud = cloud
         self.cloud_timeout = cloud_timeout
         self.silent_fallback = silent_fallback
         
+        # Cache of CLOUD responses (LRU), keyed by normalized input. Off by
+        # default, like the disk cache: a hit replays a response whose
+        # secondary emotion came from an older user-cloud fingerprint and
+        # skips CLOUD's user history update. Near-duplicate matching through
+        # the embedding matrix is a further opt-in: trigram cosine can't
+        # tell "so happy" from "so sad". Slots are reused on eviction.
+        self.cache_size = max(0, cache_size)
+        self.cache_threshold = cache_threshold
+        self._cache: "OrderedDict[str, int]" = OrderedDict()  # key → slot
+        self._cache_keys: List[Optional[str]] = [None] * self.cache_size
+        self._cache_responses: List[Optional[Any]] = [None] * self.cache_size
+        self._cache_mat: Optional[np.ndarray] = None
+        if cache_threshold is not None:
+            self._cache_mat = np.zeros((self.cache_size, _EMBED_DIM), dtype=np.float32)
+        self._cache_hits = 0
+        self._cache_misses = 0
+        
+        # Persistent CLOUD cache, so restarts don't start cold
+        # Entries are (stored_at, response) pickled into a shelf. All shelf
+        # I/O runs on one dedicated thread: off the event loop, serialized,
+        # and on the thread that opened it (some dbm backends require that).
+        self.cache_ttl = cache_ttl
+        self._disk_cache: Optional[shelve.Shelf] = None
+        self._disk_executor: Optional[ThreadPoolExecutor] = None
+        if cache_path is not None:
+            path = Path(cache_path).expanduser()
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._disk_executor = ThreadPoolExecutor(max_workers=1)
+            self._disk_cache = self._disk_executor.submit(shelve.open, str(path)).result()
+        
+        # Micro-batching of concurrent CLOUD pings
+        # Worker task is started lazily (needs a running loop).
+        self.batch_window = batch_window
+        self.max_batch = max(1, max_batch)
+        self._ping_queue: Optional[asyncio.Queue] = None
+        self._batch_task: Optional[asyncio.Task] = None
+        
         # Stats (internal, for debugging)
-        self._cloud_successes = 0
-        self._cloud_failures = 0
-        self._cloud_timeouts = 0
+        self._counters = array.array("q", [0, 0, 0])  # successes, failures, timeouts
+        
+        # HAZE-only bridges skip the CLOUD plumbing on every call
+        if cloud is None and haze is not None:
+            self.respond = self._respond_haze_only
     
     @classmethod
     async def create(
@@ -106,6 +196,12 @@ class AsyncBridge:
         cloud_timeout: float = 0.5,
         enable_cloud: bool = True,
         silent_fallback: bool = True,
+        cache_size: int = 0,
+        cache_threshold: Optional[float] = None,
+        batch_window: float = 0.005,
+        max_batch: int = 16,
+        cache_path: Optional[Path] = None,
+        cache_ttl: float = 86400.0,
     ) -> "AsyncBridge":
         """
         Create bridge with both systems.
@@ -116,6 +212,14 @@ class AsyncBridge:
             cloud_timeout: Timeout for CLOUD ping
             enable_cloud: Whether to try loading CLOUD
             silent_fallback: Suppress CLOUD error messages
+            cache_size: Cache entries for CLOUD responses (0 disables). Hits
+                replay stale secondary emotions and skip CLOUD's user history
+            cache_threshold: Cosine similarity above which a near-duplicate input
+                reuses a cached response (None: exact normalized match only)
+            batch_window: Seconds to collect concurrent CLOUD pings into one batch
+            max_batch: Max inputs per CLOUD batch (1 disables batching)
+            cache_path: Shelf file persisting CLOUD responses, e.g. ~/.haze/cloud_cache (None disables)
+            cache_ttl: Seconds a persisted response stays valid
         
         Returns:
             AsyncBridge ready for use
@@ -134,6 +238,8 @@ class AsyncBridge:
         # Initialize CLOUD (optional, silent fallback)
         if enable_cloud and HAS_CLOUD:
             try:
+                from cloud import AsyncCloud
+                
                 if cloud_models_dir and cloud_models_dir.exists():
                     cloud = await AsyncCloud.create(models_dir=cloud_models_dir)
                 else:
@@ -151,6 +257,12 @@ class AsyncBridge:
             cloud=cloud,
             cloud_timeout=cloud_timeout,
             silent_fallback=silent_fallback,
+            cache_size=cache_size,
+            cache_threshold=cache_threshold,
+            batch_window=batch_window,
+            max_batch=max_batch,
+            cache_path=cache_path,
+            cache_ttl=cache_ttl,
         )
     
     async def __aenter__(self) -> "AsyncBridge":
@@ -159,31 +271,251 @@ class AsyncBridge:
     
     async def __aexit__(self, *args) -> None:
         """Context manager exit with cleanup."""
+        if self._batch_task:
+            self._batch_task.cancel()
+            try:
+                await self._batch_task
+            except asyncio.CancelledError:
+                pass
+            self._batch_task = None
+            # Inputs still queued will never be pinged
+            while not self._ping_queue.empty():
+                _, fut = self._ping_queue.get_nowait()
+                fut.cancel()
         if self.haze:
             await self.haze.__aexit__(*args)
         if self.cloud:
             await self.cloud.close()
+        if self._disk_cache is not None:
+            shelf, self._disk_cache = self._disk_cache, None
+            await self._disk_call(shelf.close)
+            self._disk_executor.shutdown(wait=False)
+            self._disk_executor = None
+    
+    def _cache_lookup(self, key: str, emb: Optional[np.ndarray]) -> Optional[Any]:
+        """
+        Find a cached CLOUD response for this input.
+        
+        Exact key first, then (if enabled) the most similar cached
+        embedding above cache_threshold. Returns None on miss.
+        """
+        slot = self._cache.get(key)
+        if slot is None and emb is not None and self._cache:
+            sims = self._cache_mat @ emb  # empty slots are zero vectors
+            best = int(np.argmax(sims))
+            if sims[best] > self.cache_threshold:
+                slot = best
+        
+        if slot is None:
+            self._cache_misses += 1
+            return None
+        
+        self._cache_hits += 1
+        self._cache.move_to_end(self._cache_keys[slot])
+        return self._cache_responses[slot]
+    
+    def _cache_store(self, key: str, emb: Optional[np.ndarray], response: Any) -> None:
+        """Insert a CLOUD response, evicting the least recently used entry."""
+        if key in self._cache:
+            slot = self._cache[key]
+            self._cache.move_to_end(key)
+        elif len(self._cache) < self.cache_size:
+            slot = len(self._cache)
+        else:
+            _, slot = self._cache.popitem(last=False)
+        
+        self._cache[key] = slot
+        self._cache_keys[slot] = key
+        self._cache_responses[slot] = response
+        if emb is not None:
+            self._cache_mat[slot] = emb
+    
+    async def _disk_call(self, fn, *args) -> Any:
+        """Run a blocking shelf operation on the disk-cache thread."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._disk_executor, fn, *args)
+    
+    async def _disk_lookup(self, key: str) -> Optional[Any]:
+        """Fetch a fresh CLOUD response from the disk cache, or None."""
+        if self._disk_cache is None:
+            return None
+        entry = await self._disk_call(self._disk_get, _disk_key(key))
+        if entry is None:
+            return None
+        stored_at, response = entry
+        if time.time() - stored_at > self.cache_ttl:
+            return None
+        return response
+    
+    async def _disk_store(self, key: str, response: Any) -> None:
+        """Persist a CLOUD response (silent on failure)."""
+        if self._disk_cache is not None:
+            await self._disk_call(
+                self._disk_put, _disk_key(key), (time.time(), response)
+            )
+    
+    def _disk_get(self, disk_key: str) -> Optional[tuple]:
+        """Blocking shelf read (worker thread)."""
+        try:
+            return self._disk_cache.get(disk_key)
+        except Exception:
+            return None  # unreadable entry (e.g. CloudResponse changed)
+    
+    def _disk_put(self, disk_key: str, entry: tuple) -> None:
+        """Blocking shelf write (worker thread)."""
+        try:
+            self._disk_cache[disk_key] = entry
+        except Exception:
+            pass
+    
+    async def _submit(self, user_input: str) -> Any:
+        """
+        Queue an input for the next CLOUD batch and wait for its result.
+        
+        With max_batch=1 this is a plain ping.
+        """
+        if self.max_batch <= 1:
+            return await self.cloud.ping(user_input)
+        
+        if self._batch_task is None or self._batch_task.done():
+            self._ping_queue = asyncio.Queue()
+            self._batch_task = asyncio.create_task(self._batch_worker())
+        
+        future = asyncio.get_running_loop().create_future()
+        await self._ping_queue.put((user_input, future))
+        return await future
+    
+    async def _batch_worker(self) -> None:
+        """
+        Collect queued inputs for up to batch_window, then ping them together.
+        
+        Futures that were cancelled meanwhile (timeouts) are skipped; every
+        other future is resolved, failed or cancelled before the next batch.
+        """
+        queue = self._ping_queue
+        loop = asyncio.get_running_loop()
+        
+        while True:
+            batch = [await queue.get()]
+            results: Optional[List[Any]] = None
+            try:
+                deadline = loop.time() + self.batch_window
+                while len(batch) < self.max_batch:
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(queue.get(), remaining))
+                    except asyncio.TimeoutError:
+                        break
+                
+                batch = [(text, fut) for text, fut in batch if not fut.done()]
+                if not batch:
+                    continue
+                
+                texts = [text for text, _ in batch]
+                if hasattr(self.cloud, "ping_batch"):
+                    results = list(await self.cloud.ping_batch(texts))
+                else:
+                    results = await asyncio.gather(
+                        *(self.cloud.ping(text) for text in texts),
+                        return_exceptions=True,
+                    )
+            except Exception as e:
+                results = [e] * len(batch)
+            finally:
+                # Every future gets an outcome, even if CLOUD returned
+                # short or this worker is being cancelled mid-batch
+                for i, (_, fut) in enumerate(batch):
+                    if fut.done():
+                        continue
+                    if results is None:
+                        fut.cancel()
+                    elif i >= len(results):
+                        fut.set_exception(RuntimeError("CLOUD batch returned no result"))
+                    elif isinstance(results[i], BaseException):
+                        # gather() also returns CancelledError, which is
+                        # not an Exception; never hand it out as a result
+                        fut.set_exception(results[i])
+                    else:
+                        fut.set_result(results[i])
     
     async def _ping_cloud_silent(self, user_input: str) -> Optional[Any]:
         """
         Ping CLOUD with silent fallback.
         
+        Repeated inputs (and near-duplicates, if cache_threshold is set)
+        are answered from the cache; CLOUD's user history is not updated
+        on a hit.
+        
         Returns CloudResponse or None (never raises).
         """
         if not self.cloud:
             return None
         
+        key = emb = None
+        if self.cache_size or self._disk_cache is not None:
+            key = _normalize_input(user_input)
+        if self.cache_size:
+            if self._cache_mat is not None:
+                emb = _embed_input(key)
+            cached = self._cache_lookup(key, emb)
+            if cached is not None:
+                return cached
+        if self._disk_cache is not None:
+            cached = await self._disk_lookup(key)
+            if cached is not None:
+                if self.cache_size:
+                    self._cache_store(key, emb, cached)
+                return cached
+        
         try:
-            return await asyncio.wait_for(
-                self.cloud.ping(user_input),
-                timeout=self.cloud_timeout,
-            )
-        except asyncio.TimeoutError:
-            self._cloud_timeouts += 1
+            if _HAS_ASYNC_TIMEOUT:
+                async with asyncio.timeout(self.cloud_timeout):
+                    response = await self._submit(user_input)
+            else:
+                response = await asyncio.wait_for(
+                    self._submit(user_input),
+                    timeout=self.cloud_timeout,
+                )
+        except asyncio.CancelledError:
+            raise  # shutdown, not a CLOUD failure
+        except (TimeoutError, asyncio.TimeoutError):
+            self._counters[_TIMEOUTS] += 1
             return None
         except Exception:
-            self._cloud_failures += 1
+            self._counters[_FAILURES] += 1
             return None
+        
+        if response is not None:
+            if self.cache_size:
+                self._cache_store(key, emb, response)
+            if self._disk_cache is not None:
+                await self._disk_store(key, response)
+        return response
+    
+    async def warm_cache(self, corpus: Iterable[str]) -> int:
+        """
+        Pre-populate the caches by pinging CLOUD for each input.
+        
+        Inputs are sent max_batch at a time so they share CLOUD batches
+        without queueing past cloud_timeout.
+        
+        Returns:
+            Number of inputs that now have a cached response
+        """
+        if not self.cloud or not (self.cache_size or self._disk_cache is not None):
+            return 0
+        
+        texts = list(corpus)
+        warmed = 0
+        for i in range(0, len(texts), self.max_batch):
+            chunk = texts[i:i + self.max_batch]
+            results = await asyncio.gather(
+                *(self._ping_cloud_silent(t) for t in chunk)
+            )
+            warmed += sum(r is not None for r in results)
+        return warmed
     
     async def respond(
         self,
@@ -214,7 +546,7 @@ class AsyncBridge:
         if use_cloud and self.cloud:
             cloud_hint = await self._ping_cloud_silent(user_input)
             if cloud_hint:
-                self._cloud_successes += 1
+                self._counters[_SUCCESSES] += 1
         
         # 2. HAZE generates
         if self.haze:
@@ -243,19 +575,50 @@ class AsyncBridge:
             haze_available=self.haze is not None,
         )
     
+    async def _respond_haze_only(
+        self,
+        user_input: str,
+        use_cloud: bool = True,
+        **haze_kwargs,
+    ) -> BridgeResponse:
+        """respond() specialized for bridges without CLOUD (bound in __init__)."""
+        try:
+            haze_response = await self.haze.respond(user_input, **haze_kwargs)
+        except Exception as e:
+            text = f"[HAZE error: {e}]"
+            return BridgeResponse(text=text, raw_text=text, haze_available=True)
+        return BridgeResponse(
+            text=haze_response.text,
+            raw_text=haze_response.raw_text,
+            haze_response=haze_response,
+            haze_available=True,
+        )
+    
     def stats(self) -> Dict[str, Any]:
         """Return bridge statistics."""
-        total_cloud = self._cloud_successes + self._cloud_failures + self._cloud_timeouts
-        success_rate = self._cloud_successes / total_cloud if total_cloud > 0 else 0.0
+        successes, failures, timeouts = self._counters
+        total_cloud = successes + failures + timeouts
+        success_rate = successes / total_cloud if total_cloud > 0 else 0.0
         
         return {
             "haze_available": self.haze is not None,
             "cloud_available": self.cloud is not None,
-            "cloud_successes": self._cloud_successes,
-            "cloud_failures": self._cloud_failures,
-            "cloud_timeouts": self._cloud_timeouts,
+            "cloud_successes": successes,
+            "cloud_failures": failures,
+            "cloud_timeouts": timeouts,
             "cloud_success_rate": success_rate,
         }
+    
+    def cache_stats(self) -> Dict[str, Any]:
+        """Return CLOUD response cache statistics."""
+        lookups = self._cache_hits + self._cache_misses
+        return {
+            "size": len(self._cache),
+            "capacity": self.cache_size,
+            "hits": self._cache_hits,
+            "misses": self._cache_misses,
+            "hit_rate": self._cache_hits / lookups if lookups > 0 else 0.0,
+        }
 
 
 # Convenience functions for standalone usage
@@ -413,8 +776,10 @@ if __name__ == "__main__":
         print("Testing bridge responses:")
         print("-" * 60)
         
-        for text in test_inputs:
-            response = await bridge.respond(text)
+        # Concurrent responds share one micro-batched CLOUD call
+        responses = await asyncio.gather(*(bridge.respond(t) for t in test_inputs))
+        
+        for text, response in zip(test_inputs, responses):
             print(f"\nInput: \"{text}\"")
             print(f"  Response: {response.text[:80]}...")
             if response.cloud_hint:
@@ -30,20 +30,48 @@ Usage:
         print(f"Primary: {response.primary}, Secondary: {response.secondary}")
 """
 
-from .cloud import Cloud, CloudResponse, AsyncCloud
-from .chambers import CrossFireSystem, ChamberMLP, AsyncCrossFireSystem
-from .observer import MetaObserver, AsyncMetaObserver
-from .resonance import SimpleResonanceLayer, ResonanceLayer
-from .user_cloud import UserCloud, EmotionEvent, AsyncUserCloud
-from .anomaly import detect_anomalies, AnomalyReport
-from .feedback import measure_coherence, update_coupling
-from .anchors import (
-    EMOTION_ANCHORS,
-    CHAMBER_NAMES,
-    COUPLING_MATRIX,
-    get_all_anchors,
-    get_chamber_ranges,
-)
+import importlib
+
+# Submodules load on first attribute access (PEP 562), so importing the
+# package — or probing it from bridge.py — stays cheap for HAZE-only runs.
+_LAZY = {
+    "Cloud": ".cloud",
+    "CloudResponse": ".cloud",
+    "AsyncCloud": ".cloud",
+    "CrossFireSystem": ".chambers",
+    "ChamberMLP": ".chambers",
+    "AsyncCrossFireSystem": ".chambers",
+    "MetaObserver": ".observer",
+    "AsyncMetaObserver": ".observer",
+    "SimpleResonanceLayer": ".resonance",
+    "ResonanceLayer": ".resonance",
+    "UserCloud": ".user_cloud",
+    "EmotionEvent": ".user_cloud",
+    "AsyncUserCloud": ".user_cloud",
+    "detect_anomalies": ".anomaly",
+    "AnomalyReport": ".anomaly",
+    "measure_coherence": ".feedback",
+    "update_coupling": ".feedback",
+    "EMOTION_ANCHORS": ".anchors",
+    "CHAMBER_NAMES": ".anchors",
+    "COUPLING_MATRIX": ".anchors",
+    "get_all_anchors": ".anchors",
+    "get_chamber_ranges": ".anchors",
+}
+
+
+def __getattr__(name):
+    try:
+        module = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
 
 __version__ = "3.1.0"
 
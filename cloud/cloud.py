@@ -14,7 +14,7 @@ from __future__ import annotations
 import asyncio
 import numpy as np
 from pathlib import Path
-from typing import Optional, Dict
+from typing import Optional, Dict, List
 from dataclasses import dataclass
 
 from .resonance import SimpleResonanceLayer
@@ -118,29 +118,61 @@ class Cloud:
         Returns:
             CloudResponse with primary, secondary, and metadata
         """
+        parts = await asyncio.to_thread(self._resonate, user_input)
+        return self._observe(parts)
+
+    async def ping_batch(self, user_inputs: List[str]) -> List[CloudResponse]:
+        """
+        Async ping for several inputs in one worker-thread hop.
+
+        Inputs are observed in order, so the user cloud sees the
+        same event sequence as consecutive ping() calls.
+        """
+        all_parts = await asyncio.to_thread(
+            lambda: [self._resonate(text) for text in user_inputs]
+        )
+        return [self._observe(parts) for parts in all_parts]
+
+    def _resonate(self, user_input: str) -> tuple:
+        """
+        Stateless half of the ping (CPU-bound, runs off the event loop).
+
+        Reads only model weights, never the user cloud.
+        """
         # 1. Resonance layer (weightless geometry)
         resonances = self.resonance.compute_resonance(user_input)
         primary_idx, primary_word, _ = self.resonance.get_primary_emotion(resonances)
 
-        # 2. Chamber cross-fire (async parallelism for future optimization)
-        chamber_activations, iterations = await asyncio.to_thread(
-            self.chambers.stabilize,
-            resonances,
-        )
+        # 2. Chamber cross-fire
+        chamber_activations, iterations = self.chambers.stabilize(resonances)
+
+        # 3. Anomaly detection
+        anomaly = detect_anomalies(chamber_activations, iterations)
+
+        return (resonances, primary_idx, primary_word,
+                chamber_activations, iterations, anomaly)
+
+    def _observe(self, parts: tuple) -> CloudResponse:
+        """
+        Stateful half of the ping: reads and updates the user cloud.
 
-        # 3. User fingerprint (temporal history)
+        Runs on the caller's thread, only after _resonate returned, so a
+        cancelled or timed-out ping records no event.
+        """
+        (resonances, primary_idx, primary_word,
+         chamber_activations, iterations, anomaly) = parts
+
+        # 4. User fingerprint (temporal history)
         user_fingerprint = self.user_cloud.get_fingerprint()
 
-        # 4. Meta-observer predicts secondary (now with chamber_activations)
+        # 5. Meta-observer predicts secondary (now with chamber_activations)
         # Convert chamber_activations dict to array for observer
-        import numpy as np
         from .anchors import CHAMBER_NAMES_EXTENDED
         chamber_array = np.array([
             chamber_activations.get(name, 0.0) for name in CHAMBER_NAMES_EXTENDED
         ], dtype=np.float32)
         
-        secondary_idx = await asyncio.to_thread(
-            self.observer.predict_secondary,
+        secondary_idx = self.observer.predict_secondary(
             resonances,
             chamber_array,
             float(iterations),
@@ -148,9 +180,6 @@ class Cloud:
         )
         secondary_word = self.anchors[secondary_idx]
 
-        # 5. Anomaly detection
-        anomaly = detect_anomalies(chamber_activations, iterations)
-
         # 6. Update user cloud
         self.user_cloud.add_event(primary_idx, secondary_idx)
 
@@ -165,8 +194,13 @@ class Cloud:
         )
 
     def ping_sync(self, user_input: str) -> CloudResponse:
-        """Synchronous version of ping (for testing)."""
-        return asyncio.run(self.ping(user_input))
+        """
+        Synchronous version of ping (for testing).
+
+        Runs the pipeline directly: no event loop or worker thread,
+        and safe to call from inside a running loop.
+        """
+        return self._observe(self._resonate(user_input))
 
     def param_count(self) -> int:
         """Total trainable parameters."""
@@ -247,6 +281,18 @@ class AsyncCloud:
         async with self._lock:
             return await self._sync.ping(user_input)
     
+    async def ping_batch(self, user_inputs: List[str]) -> List[CloudResponse]:
+        """
+        Async batched ping with field lock.
+        
+        One lock acquisition and one thread hop for the whole batch.
+        """
+        if self._closed:
+            raise RuntimeError("AsyncCloud is closed")
+        
+        async with self._lock:
+            return await self._sync.ping_batch(user_inputs)
+    
     async def save(self, models_dir: Path) -> None:
         """Save all components with lock protection."""
         async with self._lock:
@@ -292,9 +338,10 @@ if __name__ == "__main__":
     print("Testing CLOUD pings:")
     print("=" * 60)
 
-    for text in test_inputs:
-        response = cloud.ping_sync(text)
+    # One event loop and one worker thread for the whole set
+    responses = asyncio.run(cloud.ping_batch(test_inputs))
 
+    for text, response in zip(test_inputs, responses):
         print(f"\nInput: \"{text}\"")
         print(f"  Primary:   {response.primary}")
         print(f"  Secondary: {response.secondary}")
@@ -0,0 +1,7 @@
+# _compat.py — Small shims for the supported Python range (3.8+)
+
+import sys
+
+
+# __slots__ on dataclasses needs Python 3.10+; splat into @dataclass(...)
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
@@ -20,28 +20,80 @@
 # Co-authored by Claude, January 2026
 
 from __future__ import annotations
-from dataclasses import dataclass, field
-from typing import Optional
-import math
+import random
+import re
+import sys
+from dataclasses import dataclass, fields
+from enum import IntEnum
+from functools import lru_cache
+from typing import Final, List
+
+import numpy as np
+
+try:
+    from ._compat import DATACLASS_SLOTS
+except ImportError:
+    from _compat import DATACLASS_SLOTS
+
+_random = random.random
+_randint = random.randint
+
+# Optional: numba JIT for the batched (AMKStateBatch) step kernel
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda fn: fn
 
 
 # ============================================================================
 # VELOCITY MODES — movement IS language
 # ============================================================================
 
-class VelocityMode:
+# Plain int constants for kernel code (global load, folded by numba)
+NOMOVE: Final[int] = 0     # cold observer (temp × 0.5)
+WALK: Final[int] = 1       # balanced (temp × 0.85)
+RUN: Final[int] = 2        # high entropy chaos (temp × 1.2)
+BACKWARD: Final[int] = -1  # time rewind, debt forgiveness
+
+
+class VelocityMode(IntEnum):
     """Movement velocity affects temperature."""
-    NOMOVE = 0    # cold observer (temp × 0.5)
-    WALK = 1      # balanced (temp × 0.85)
-    RUN = 2       # high entropy chaos (temp × 1.2)
-    BACKWARD = -1 # time rewind, debt forgiveness
+    NOMOVE = NOMOVE
+    WALK = WALK
+    RUN = RUN
+    BACKWARD = BACKWARD
+
+
+# DSL VELOCITY argument → velocity_mode
+_VELOCITY_NAMES = {
+    "RUN": RUN,
+    "WALK": WALK,
+    "NOMOVE": NOMOVE,
+    "BACKWARD": BACKWARD,
+}
+
+# velocity_mode → (temperature multiplier, time direction)
+_VELOCITY_TABLE = {
+    NOMOVE: (0.5, 1.0),     # cold observer
+    WALK: (0.85, 1.0),      # balanced
+    RUN: (1.2, 1.0),        # chaotic
+    BACKWARD: (0.7, -1.0),  # structural
+}
 
 
 # ============================================================================
 # AMK STATE — the breath of the field
 # ============================================================================
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class AMKState:
     """
     Arianna Method Kernel state.
@@ -82,7 +134,7 @@ class AMKState:
     # MOVEMENT — the body in the field
     # ─────────────────────────────────────────────────────────────────────────
     pending_jump: int = 0           # queued jump (sim steps)
-    velocity_mode: int = VelocityMode.WALK
+    velocity_mode: int = WALK
     velocity_magnitude: float = 0.5
     base_temperature: float = 1.0
     effective_temp: float = 0.85    # computed: base × velocity modifier
@@ -103,6 +155,125 @@ class AMKState:
     cosmic_coherence: float = 0.5    # from CLOUD or external
 
 
+# ============================================================================
+# STEP KERNELS — per-step field physics
+# ============================================================================
+# The scalar kernels run as plain Python for a single AMK: numba's
+# per-call dispatch and boxing cost more than these few flops. Only the
+# array loop in _amk_step_batch is JIT-compiled (lazily, on first use).
+
+# Below this, debts and suffering are treated as settled
+_EPS: Final[float] = 1e-9
+
+
+def _amk_step_scalar(debt, debt_decay, temporal_debt, velocity_mode,
+                     tension, dissonance, cosmic_coherence, dt):
+    """One AMK.step on scalars. Returns (debt, temporal_debt, tension, dissonance)."""
+    # Debt decay (flush residue to zero rather than decaying into denormals)
+    if debt > _EPS:
+        debt *= debt_decay
+    else:
+        debt = 0.0
+    
+    # Temporal debt accumulation/decay
+    if velocity_mode == BACKWARD and dt > 0:
+        temporal_debt += 0.01 * dt
+    elif temporal_debt > _EPS:
+        temporal_debt *= 0.9995
+    else:
+        temporal_debt = 0.0
+    if temporal_debt > 10.0:
+        temporal_debt = 10.0
+    
+    # Cosmic coherence healing (nothing to heal in a calm field)
+    if cosmic_coherence > 0 and dt > 0 and (tension > _EPS or dissonance > _EPS):
+        heal_rate = 0.998 - 0.003 * (0.5 + 0.5 * cosmic_coherence)
+        tension *= heal_rate
+        dissonance *= heal_rate
+    
+    return debt, temporal_debt, tension, dissonance
+
+
+def _amk_pain_scalar(tension, dissonance, debt):
+    """AMK.compute_pain on scalars."""
+    arousal = tension * 1.5  # proxy
+    debt_norm = debt / 10.0
+    if debt_norm > 1.0:
+        debt_norm = 1.0
+    
+    pain = 0.25 * arousal + 0.35 * tension + 0.25 * dissonance + 0.15 * debt_norm
+    return _clamp01(pain)
+
+
+_amk_step_scalar_jit = njit(cache=True, fastmath=True)(_amk_step_scalar)
+
+
+@njit(cache=True, fastmath=True, parallel=True)
+def _amk_step_batch(debt, debt_decay, temporal_debt, velocity_mode,
+                    tension, dissonance, cosmic_coherence, dt):
+    """_amk_step_scalar over (N,) arrays, in place."""
+    for i in prange(debt.shape[0]):
+        debt[i], temporal_debt[i], tension[i], dissonance[i] = _amk_step_scalar_jit(
+            debt[i], debt_decay[i], temporal_debt[i], velocity_mode[i],
+            tension[i], dissonance[i], cosmic_coherence[i], dt,
+        )
+
+
+# ============================================================================
+# DSL HELPERS
+# ============================================================================
+
+def _clamp(x, lo, hi):
+    """max(lo, min(hi, x)) without the builtin calls (NaN still maps to hi)."""
+    return x if lo <= x <= hi else (lo if x < lo else hi)
+
+
+def _clamp01(x):
+    return x if 0.0 <= x <= 1.0 else (0.0 if x < 0.0 else 1.0)
+
+
+# DSL arguments repeat across runs ("0.7", "12", "RUN"), so conversions are memoized
+@lru_cache(maxsize=256)
+def _safe_float(s):
+    try:
+        return float(s)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+@lru_cache(maxsize=256)
+def _safe_int(s):
+    try:
+        return int(s)
+    except (TypeError, ValueError):
+        return 0
+
+
+_upper = lru_cache(maxsize=64)(str.upper)
+
+
+# One DSL line: command word, optional argument. Horizontal whitespace
+# only ([^\S\n]), so blank and '#' comment lines simply don't match.
+_SCRIPT_RE = re.compile(r"^[^\S\n]*([A-Za-z_]\w*)(?:[^\S\n]+(.*?))?[^\S\n]*$", re.MULTILINE)
+
+
+@lru_cache(maxsize=128)
+def _compile_script(script: str) -> tuple:
+    """
+    Parse a DSL script once into (handler, arg) pairs.
+    
+    Comments, blank lines and unknown commands are dropped here,
+    so re-running a cached script only calls handlers.
+    """
+    compiled = []
+    for match in _SCRIPT_RE.finditer(script):
+        cmd, arg = match.groups()
+        handler = AMK._DISPATCH.get(sys.intern(cmd.upper()))
+        if handler is not None:
+            compiled.append((handler, arg or ""))
+    return tuple(compiled)
+
+
 # ============================================================================
 # AMK KERNEL — the breath
 # ============================================================================
@@ -120,6 +291,8 @@ class AMK:
         - Call `update_debt(destined, manifested)` after generation
     """
     
+    __slots__ = ("state",)
+    
     def __init__(self):
         self.state = AMKState()
         self._update_effective_temp()
@@ -140,28 +313,14 @@ class AMK:
     
     def _update_effective_temp(self):
         """Update effective temperature based on velocity mode."""
-        base = self.state.base_temperature
-        mode = self.state.velocity_mode
-        
-        if mode == VelocityMode.NOMOVE:
-            self.state.effective_temp = base * 0.5   # cold observer
-            self.state.time_direction = 1.0
-        elif mode == VelocityMode.WALK:
-            self.state.effective_temp = base * 0.85  # balanced
-            self.state.time_direction = 1.0
-        elif mode == VelocityMode.RUN:
-            self.state.effective_temp = base * 1.2   # chaotic
-            self.state.time_direction = 1.0
-        elif mode == VelocityMode.BACKWARD:
-            self.state.effective_temp = base * 0.7   # structural
-            self.state.time_direction = -1.0
-        else:
-            self.state.effective_temp = base
-            self.state.time_direction = 1.0
+        s = self.state
+        mult, direction = _VELOCITY_TABLE.get(s.velocity_mode, (1.0, 1.0))
+        s.effective_temp = s.base_temperature * mult
+        s.time_direction = direction
     
     def set_velocity(self, mode: int):
         """Set velocity mode and update temperature."""
-        self.state.velocity_mode = max(-1, min(2, mode))
+        self.state.velocity_mode = int(_clamp(mode, BACKWARD, RUN))
         self._update_effective_temp()
     
     # ─────────────────────────────────────────────────────────────────────────
@@ -182,19 +341,16 @@ class AMK:
         Returns:
             Effective temperature for sampling (0.3 to 2.0 typical)
         """
-        temp = self.state.effective_temp
-        
-        # Pain reduces temperature (need stability when suffering)
-        temp -= self.state.pain * 0.3
-        
-        # Dissonance increases temperature (chaos breeds chaos)
-        temp += self.state.dissonance * 0.25
-        
-        # Attend spread increases temperature
-        temp += self.state.attend_spread * 0.2
+        s = self.state
+        temp = (
+            s.effective_temp
+            - s.pain * 0.3            # pain → stability when suffering
+            + s.dissonance * 0.25     # dissonance → chaos breeds chaos
+            + s.attend_spread * 0.2   # spread → blur
+        )
         
         # Clamp to reasonable range
-        return max(0.3, min(2.0, temp))
+        return _clamp(temp, 0.3, 2.0)
     
     def get_destiny_bias(self) -> float:
         """
@@ -222,15 +378,13 @@ class AMK:
         Returns:
             True if should skip ahead in generation
         """
-        import random
         if self.state.dissonance < self.state.tunnel_threshold:
             return False
-        return random.random() < self.state.tunnel_chance
+        return _random() < self.state.tunnel_chance
     
     def get_tunnel_skip(self) -> int:
         """Get number of tokens to skip during tunnel."""
-        import random
-        return random.randint(1, self.state.tunnel_skip_max)
+        return _randint(1, self.state.tunnel_skip_max)
     
     # ─────────────────────────────────────────────────────────────────────────
     # PROPHECY DEBT — |destined - manifested|
@@ -242,16 +396,17 @@ class AMK:
         
         debt += |destined - manifested|
         
+        Called once per turn: there is no rollout over the prophecy
+        horizon, so debt is one scalar update (batched across states by
+        AMKStateBatch.update_debt).
+        
         Args:
             destined: expected/predicted value (e.g., top probability)
             manifested: actual value (e.g., selected probability)
         """
-        delta = abs(destined - manifested)
-        self.state.debt += delta
-        
-        # Cap debt
-        if self.state.debt > 100.0:
-            self.state.debt = 100.0
+        s = self.state
+        debt = s.debt + abs(destined - manifested)
+        s.debt = 100.0 if debt > 100.0 else debt  # cap
     
     # ─────────────────────────────────────────────────────────────────────────
     # STEP — advance field physics
@@ -266,25 +421,11 @@ class AMK:
         Args:
             dt: time delta (default 1.0 for one turn)
         """
-        # Debt decay
-        self.state.debt *= self.state.debt_decay
-        
-        # Temporal debt accumulation/decay
-        if self.state.velocity_mode == VelocityMode.BACKWARD and dt > 0:
-            self.state.temporal_debt += 0.01 * dt
-        else:
-            self.state.temporal_debt *= 0.9995
-        
-        # Clamp temporal debt
-        if self.state.temporal_debt > 10.0:
-            self.state.temporal_debt = 10.0
-        
-        # Cosmic coherence healing
-        if self.state.cosmic_coherence > 0 and dt > 0:
-            coherence_factor = 0.5 + 0.5 * self.state.cosmic_coherence
-            heal_rate = 0.998 - (0.003 * coherence_factor)
-            self.state.tension *= heal_rate
-            self.state.dissonance *= heal_rate
+        s = self.state
+        s.debt, s.temporal_debt, s.tension, s.dissonance = _amk_step_scalar(
+            s.debt, s.debt_decay, s.temporal_debt, s.velocity_mode,
+            s.tension, s.dissonance, s.cosmic_coherence, dt,
+        )
     
     # ─────────────────────────────────────────────────────────────────────────
     # PAIN — composite suffering
@@ -298,17 +439,9 @@ class AMK:
         
         (Simplified: arousal not tracked, use tension×1.5)
         """
-        arousal = self.state.tension * 1.5  # proxy
-        debt_norm = min(1.0, self.state.debt / 10.0)
-        
-        self.state.pain = (
-            0.25 * arousal +
-            0.35 * self.state.tension +
-            0.25 * self.state.dissonance +
-            0.15 * debt_norm
-        )
-        self.state.pain = min(1.0, max(0.0, self.state.pain))
-        return self.state.pain
+        s = self.state
+        s.pain = _amk_pain_scalar(s.tension, s.dissonance, s.debt)
+        return s.pain
     
     # ─────────────────────────────────────────────────────────────────────────
     # CLOUD INTEGRATION — emotional topology from CLOUD chambers
@@ -334,18 +467,20 @@ class AMK:
         flow = float(chamber_activations.get("FLOW", 0))
         complex_ = float(chamber_activations.get("COMPLEX", 0))
         
+        s = self.state
+        
         # FEAR + VOID → tension
-        self.state.tension = min(1.0, fear * 0.5 + void * 0.3)
+        s.tension = min(1.0, fear * 0.5 + void * 0.3)
         
         # RAGE → dissonance
-        self.state.dissonance = min(1.0, rage * 0.7)
+        s.dissonance = min(1.0, rage * 0.7)
         
         # LOVE → reduces tension (healing)
         if love > 0.3:
-            self.state.tension *= (1.0 - love * 0.5)
+            s.tension *= (1.0 - love * 0.5)
         
         # FLOW + COMPLEX → cosmic coherence
-        self.state.cosmic_coherence = min(1.0, flow * 0.5 + complex_ * 0.3 + 0.2)
+        s.cosmic_coherence = min(1.0, flow * 0.5 + complex_ * 0.3 + 0.2)
         
         # Recompute pain
         self.compute_pain()
@@ -378,16 +513,8 @@ class AMK:
             return ""
         
         results = []
-        for line in script.strip().split("\n"):
-            line = line.strip()
-            if not line or line.startswith("#"):
-                continue
-            
-            parts = line.split(maxsplit=1)
-            cmd = parts[0].upper()
-            arg = parts[1] if len(parts) > 1 else ""
-            
-            result = self._exec_command(cmd, arg)
+        for handler, arg in _compile_script(script):
+            result = handler(self, arg)
             if result:
                 results.append(result)
         
@@ -395,120 +522,133 @@ class AMK:
     
     def _exec_command(self, cmd: str, arg: str) -> str:
         """Execute single command."""
-        
-        def clamp01(x):
-            return max(0.0, min(1.0, x))
-        
-        def safe_float(s):
-            try:
-                return float(s)
-            except:
-                return 0.0
-        
-        def safe_int(s):
-            try:
-                return int(s)
-            except:
-                return 0
-        
-        # PROPHECY PHYSICS
-        if cmd == "PROPHECY":
-            self.state.prophecy = max(1, min(64, safe_int(arg)))
-            return f"[prophecy: {self.state.prophecy}]"
-        
-        elif cmd == "DESTINY":
-            self.state.destiny = clamp01(safe_float(arg))
-            return f"[destiny: {self.state.destiny:.2f}]"
-        
-        elif cmd == "WORMHOLE":
-            self.state.wormhole = clamp01(safe_float(arg))
-            return f"[wormhole: {self.state.wormhole:.2f}]"
-        
-        elif cmd == "CALENDAR_DRIFT":
-            self.state.calendar_drift = max(0, min(30, safe_float(arg)))
-            return f"[calendar_drift: {self.state.calendar_drift:.1f}]"
-        
-        # ATTENTION PHYSICS
-        elif cmd == "ATTEND_FOCUS":
-            self.state.attend_focus = clamp01(safe_float(arg))
-            return f"[attend_focus: {self.state.attend_focus:.2f}]"
-        
-        elif cmd == "ATTEND_SPREAD":
-            self.state.attend_spread = clamp01(safe_float(arg))
-            return f"[attend_spread: {self.state.attend_spread:.2f}]"
-        
-        # TUNNELING
-        elif cmd == "TUNNEL_THRESHOLD":
-            self.state.tunnel_threshold = clamp01(safe_float(arg))
-            return f"[tunnel_threshold: {self.state.tunnel_threshold:.2f}]"
-        
-        elif cmd == "TUNNEL_CHANCE":
-            self.state.tunnel_chance = clamp01(safe_float(arg))
-            return f"[tunnel_chance: {self.state.tunnel_chance:.2f}]"
-        
-        elif cmd == "TUNNEL_SKIP_MAX":
-            self.state.tunnel_skip_max = max(1, min(24, safe_int(arg)))
-            return f"[tunnel_skip_max: {self.state.tunnel_skip_max}]"
-        
-        # SUFFERING
-        elif cmd == "PAIN":
-            self.state.pain = clamp01(safe_float(arg))
-            return f"[pain: {self.state.pain:.2f}]"
-        
-        elif cmd == "TENSION":
-            self.state.tension = clamp01(safe_float(arg))
-            return f"[tension: {self.state.tension:.2f}]"
-        
-        elif cmd == "DISSONANCE":
-            self.state.dissonance = clamp01(safe_float(arg))
-            return f"[dissonance: {self.state.dissonance:.2f}]"
-        
-        # MOVEMENT
-        elif cmd == "VELOCITY":
-            mode_map = {
-                "RUN": VelocityMode.RUN,
-                "WALK": VelocityMode.WALK,
-                "NOMOVE": VelocityMode.NOMOVE,
-                "BACKWARD": VelocityMode.BACKWARD,
-            }
-            mode = mode_map.get(arg.upper(), VelocityMode.WALK)
-            self.set_velocity(mode)
-            return f"[velocity: {arg.upper()}, temp: {self.state.effective_temp:.2f}]"
-        
-        elif cmd == "BASE_TEMP":
-            self.state.base_temperature = max(0.1, min(3.0, safe_float(arg)))
-            self._update_effective_temp()
-            return f"[base_temp: {self.state.base_temperature:.2f}]"
-        
-        # RESETS
-        elif cmd == "RESET_FIELD":
-            self.reset()
-            return "[field reset]"
-        
-        elif cmd == "RESET_DEBT":
-            self.reset_debt()
-            return "[debt reset]"
-        
-        # LAWS
-        elif cmd == "LAW":
-            parts = arg.split(maxsplit=1)
-            if len(parts) >= 2:
-                law_name = parts[0].upper()
-                law_val = safe_float(parts[1])
-                
-                if law_name == "ENTROPY_FLOOR":
-                    self.state.entropy_floor = max(0, min(2, law_val))
-                elif law_name == "RESONANCE_CEILING":
-                    self.state.resonance_ceiling = clamp01(law_val)
-                elif law_name == "DEBT_DECAY":
-                    self.state.debt_decay = max(0.9, min(0.9999, law_val))
-                elif law_name == "EMERGENCE_THRESHOLD":
-                    self.state.emergence_threshold = clamp01(law_val)
-                
-                return f"[law {law_name}: {law_val:.4f}]"
-        
-        # Unknown command — ignore (future-proof)
-        return ""
+        handler = self._DISPATCH.get(cmd)
+        if handler is None:
+            return ""  # Unknown command — ignore (future-proof)
+        result = handler(self, arg)
+        return result
+    
+    # PROPHECY PHYSICS
+    
+    def _cmd_prophecy(self, arg: str) -> str:
+        self.state.prophecy = _clamp(_safe_int(arg), 1, 64)
+        return f"[prophecy: {self.state.prophecy}]"
+    
+    def _cmd_destiny(self, arg: str) -> str:
+        self.state.destiny = _clamp01(_safe_float(arg))
+        return f"[destiny: {self.state.destiny:.2f}]"
+    
+    def _cmd_wormhole(self, arg: str) -> str:
+        self.state.wormhole = _clamp01(_safe_float(arg))
+        return f"[wormhole: {self.state.wormhole:.2f}]"
+    
+    def _cmd_calendar_drift(self, arg: str) -> str:
+        self.state.calendar_drift = _clamp(_safe_float(arg), 0, 30)
+        return f"[calendar_drift: {self.state.calendar_drift:.1f}]"
+    
+    # ATTENTION PHYSICS
+    
+    def _cmd_attend_focus(self, arg: str) -> str:
+        self.state.attend_focus = _clamp01(_safe_float(arg))
+        return f"[attend_focus: {self.state.attend_focus:.2f}]"
+    
+    def _cmd_attend_spread(self, arg: str) -> str:
+        self.state.attend_spread = _clamp01(_safe_float(arg))
+        return f"[attend_spread: {self.state.attend_spread:.2f}]"
+    
+    # TUNNELING
+    
+    def _cmd_tunnel_threshold(self, arg: str) -> str:
+        self.state.tunnel_threshold = _clamp01(_safe_float(arg))
+        return f"[tunnel_threshold: {self.state.tunnel_threshold:.2f}]"
+    
+    def _cmd_tunnel_chance(self, arg: str) -> str:
+        self.state.tunnel_chance = _clamp01(_safe_float(arg))
+        return f"[tunnel_chance: {self.state.tunnel_chance:.2f}]"
+    
+    def _cmd_tunnel_skip_max(self, arg: str) -> str:
+        self.state.tunnel_skip_max = _clamp(_safe_int(arg), 1, 24)
+        return f"[tunnel_skip_max: {self.state.tunnel_skip_max}]"
+    
+    # SUFFERING
+    
+    def _cmd_pain(self, arg: str) -> str:
+        self.state.pain = _clamp01(_safe_float(arg))
+        return f"[pain: {self.state.pain:.2f}]"
+    
+    def _cmd_tension(self, arg: str) -> str:
+        self.state.tension = _clamp01(_safe_float(arg))
+        return f"[tension: {self.state.tension:.2f}]"
+    
+    def _cmd_dissonance(self, arg: str) -> str:
+        self.state.dissonance = _clamp01(_safe_float(arg))
+        return f"[dissonance: {self.state.dissonance:.2f}]"
+    
+    # MOVEMENT
+    
+    def _cmd_velocity(self, arg: str) -> str:
+        name = _upper(arg)
+        self.set_velocity(_VELOCITY_NAMES.get(name, WALK))
+        return f"[velocity: {name}, temp: {self.state.effective_temp:.2f}]"
+    
+    def _cmd_base_temp(self, arg: str) -> str:
+        self.state.base_temperature = _clamp(_safe_float(arg), 0.1, 3.0)
+        self._update_effective_temp()
+        return f"[base_temp: {self.state.base_temperature:.2f}]"
+    
+    # RESETS
+    
+    def _cmd_reset_field(self, arg: str) -> str:
+        self.reset()
+        return "[field reset]"
+    
+    def _cmd_reset_debt(self, arg: str) -> str:
+        self.reset_debt()
+        return "[debt reset]"
+    
+    # LAWS
+    
+    # law name → (state field, lo, hi)
+    _LAW_DISPATCH = {
+        "ENTROPY_FLOOR": ("entropy_floor", 0.0, 2.0),
+        "RESONANCE_CEILING": ("resonance_ceiling", 0.0, 1.0),
+        "DEBT_DECAY": ("debt_decay", 0.9, 0.9999),
+        "EMERGENCE_THRESHOLD": ("emergence_threshold", 0.0, 1.0),
+    }
+    
+    def _cmd_law(self, arg: str) -> str:
+        parts = arg.split(maxsplit=1)
+        if len(parts) < 2:
+            return ""
+        law_name = parts[0].upper()
+        law_val = _safe_float(parts[1])
+        
+        law = self._LAW_DISPATCH.get(law_name)
+        if law is not None:
+            name, lo, hi = law
+            setattr(self.state, name, _clamp(law_val, lo, hi))
+        
+        return f"[law {law_name}: {law_val:.4f}]"
+    
+    _DISPATCH = {
+        "PROPHECY": _cmd_prophecy,
+        "DESTINY": _cmd_destiny,
+        "WORMHOLE": _cmd_wormhole,
+        "CALENDAR_DRIFT": _cmd_calendar_drift,
+        "ATTEND_FOCUS": _cmd_attend_focus,
+        "ATTEND_SPREAD": _cmd_attend_spread,
+        "TUNNEL_THRESHOLD": _cmd_tunnel_threshold,
+        "TUNNEL_CHANCE": _cmd_tunnel_chance,
+        "TUNNEL_SKIP_MAX": _cmd_tunnel_skip_max,
+        "PAIN": _cmd_pain,
+        "TENSION": _cmd_tension,
+        "DISSONANCE": _cmd_dissonance,
+        "VELOCITY": _cmd_velocity,
+        "BASE_TEMP": _cmd_base_temp,
+        "RESET_FIELD": _cmd_reset_field,
+        "RESET_DEBT": _cmd_reset_debt,
+        "LAW": _cmd_law,
+    }
     
     # ─────────────────────────────────────────────────────────────────────────
     # STATE EXPORT
@@ -516,25 +656,192 @@ class AMK:
     
     def get_state_dict(self) -> dict:
         """Export state as dictionary for metadata."""
+        s = self.state
         return {
-            "prophecy": self.state.prophecy,
-            "destiny": self.state.destiny,
-            "wormhole": self.state.wormhole,
-            "effective_temp": self.state.effective_temp,
-            "pain": self.state.pain,
-            "tension": self.state.tension,
-            "dissonance": self.state.dissonance,
-            "debt": self.state.debt,
-            "velocity_mode": self.state.velocity_mode,
-            "cosmic_coherence": self.state.cosmic_coherence,
+            "prophecy": s.prophecy,
+            "destiny": s.destiny,
+            "wormhole": s.wormhole,
+            "effective_temp": s.effective_temp,
+            "pain": s.pain,
+            "tension": s.tension,
+            "dissonance": s.dissonance,
+            "debt": s.debt,
+            "velocity_mode": s.velocity_mode,
+            "cosmic_coherence": s.cosmic_coherence,
         }
 
 
+# ============================================================================
+# AMK STATE BATCH — many fields breathing at once (SoA)
+# ============================================================================
+
+# Integer AMKState fields; everything else is float32
+_INT_DTYPES = {
+    "prophecy": np.int32,
+    "tunnel_skip_max": np.int32,
+    "pending_jump": np.int32,
+    "velocity_mode": np.int8,
+}
+
+# Velocity lookup indexed by (mode + 1): BACKWARD, NOMOVE, WALK, RUN
+_VELOCITY_TEMP_MULT = np.array([0.7, 0.5, 0.85, 1.2], dtype=np.float32)
+_VELOCITY_TIME_DIR = np.array([-1.0, 1.0, 1.0, 1.0], dtype=np.float32)
+
+# CLOUD chamber order for batched activations, and chamber → (tension,
+# dissonance, coherence) weights matching AMK.update_from_cloud
+_CLOUD_CHAMBERS = ("FEAR", "LOVE", "RAGE", "VOID", "FLOW", "COMPLEX")
+_CLOUD_WEIGHTS = np.array([
+    [0.5, 0.0, 0.0],  # FEAR → tension
+    [0.0, 0.0, 0.0],  # LOVE (healing, applied separately)
+    [0.0, 0.7, 0.0],  # RAGE → dissonance
+    [0.3, 0.0, 0.0],  # VOID → tension
+    [0.0, 0.0, 0.5],  # FLOW → coherence
+    [0.0, 0.0, 0.3],  # COMPLEX → coherence
+], dtype=np.float32)
+
+
+# Per-field arrays
+_BATCH_FIELDS = fields(AMKState)
+
+
+class AMKStateBatch:
+    """
+    Structure-of-arrays view over N AMK states.
+    
+    Every AMKState field is a contiguous array of shape (N,), so a single
+    NumPy expression advances all N fields (multi-agent runs, prophecy
+    rollouts) instead of N Python attribute walks. Semantics mirror AMK.
+    """
+    
+    __slots__ = tuple(f.name for f in _BATCH_FIELDS)
+    
+    def __init__(self, n: int = 1):
+        for f in _BATCH_FIELDS:
+            dtype = _INT_DTYPES.get(f.name, np.float32)
+            setattr(self, f.name, np.full(n, f.default, dtype=dtype))
+        self.update_effective_temp()
+    
+    def __len__(self) -> int:
+        return len(self.debt)
+    
+    @classmethod
+    def from_states(cls, states: List[AMKState]) -> "AMKStateBatch":
+        """Pack a list of AMKState into one batch."""
+        batch = cls.__new__(cls)
+        for f in _BATCH_FIELDS:
+            dtype = _INT_DTYPES.get(f.name, np.float32)
+            values = [getattr(s, f.name) for s in states]
+            setattr(batch, f.name, np.array(values, dtype=dtype))
+        return batch
+    
+    def to_states(self) -> List[AMKState]:
+        """Unpack the batch back into AMKState objects."""
+        names = [f.name for f in _BATCH_FIELDS]
+        columns = [getattr(self, name).tolist() for name in names]
+        return [AMKState(**dict(zip(names, row))) for row in zip(*columns)]
+    
+    def update_effective_temp(self):
+        """Vectorized AMK._update_effective_temp."""
+        mode = self.velocity_mode
+        idx = np.clip(mode + 1, 0, 3)
+        known = (mode >= BACKWARD) & (mode <= RUN)
+        self.effective_temp = self.base_temperature * np.where(
+            known, _VELOCITY_TEMP_MULT[idx], np.float32(1.0)
+        )
+        self.time_direction = np.where(
+            known, _VELOCITY_TIME_DIR[idx], np.float32(1.0)
+        )
+    
+    def get_temperature(self) -> np.ndarray:
+        """Vectorized AMK.get_temperature."""
+        temp = (
+            self.effective_temp
+            - self.pain * np.float32(0.3)
+            + self.dissonance * np.float32(0.25)
+            + self.attend_spread * np.float32(0.2)
+        )
+        return np.clip(temp, 0.3, 2.0)
+    
+    def update_debt(self, destined, manifested):
+        """Vectorized AMK.update_debt (scalars or arrays of shape (N,))."""
+        self.debt += np.abs(np.asarray(destined, dtype=np.float32) - manifested)
+        np.minimum(self.debt, 100.0, out=self.debt)
+    
+    def step(self, dt: float = 1.0):
+        """Vectorized AMK.step."""
+        if HAS_NUMBA:
+            _amk_step_batch(
+                self.debt, self.debt_decay, self.temporal_debt, self.velocity_mode,
+                self.tension, self.dissonance, self.cosmic_coherence, float(dt),
+            )
+            return
+        
+        # Debt decay (all updates in place, no per-step temporaries)
+        np.multiply(self.debt, self.debt_decay, out=self.debt)
+        
+        # Temporal debt accumulation/decay
+        if dt > 0:
+            backward = self.velocity_mode == BACKWARD
+            np.add(self.temporal_debt, np.float32(0.01 * dt),
+                   out=self.temporal_debt, where=backward)
+            np.multiply(self.temporal_debt, np.float32(0.9995),
+                        out=self.temporal_debt, where=~backward)
+        else:
+            np.multiply(self.temporal_debt, np.float32(0.9995), out=self.temporal_debt)
+        np.minimum(self.temporal_debt, np.float32(10.0), out=self.temporal_debt)
+        
+        # Cosmic coherence healing
+        # heal_rate = 0.998 - 0.003 × (0.5 + 0.5 × cc) = 0.9965 - 0.0015 × cc
+        if dt > 0:
+            heal = self.cosmic_coherence > 0
+            heal_rate = self.cosmic_coherence * np.float32(-0.0015)
+            heal_rate += np.float32(0.9965)
+            np.multiply(self.tension, heal_rate, out=self.tension, where=heal)
+            np.multiply(self.dissonance, heal_rate, out=self.dissonance, where=heal)
+    
+    def update_from_cloud(self, chamber_activations):
+        """
+        Vectorized AMK.update_from_cloud.
+        
+        Args:
+            chamber_activations: (N, 6) array in _CLOUD_CHAMBERS order,
+                or a list of N chamber → activation dicts
+        """
+        if not isinstance(chamber_activations, np.ndarray):
+            chamber_activations = [
+                [float(acts.get(name, 0)) for name in _CLOUD_CHAMBERS]
+                for acts in chamber_activations
+            ]
+        acts = np.asarray(chamber_activations, dtype=np.float32).reshape(-1, 6)
+        
+        mixed = acts @ _CLOUD_WEIGHTS
+        love = acts[:, 1]
+        tension = np.minimum(1.0, mixed[:, 0])
+        self.tension = np.where(love > 0.3, tension * (1.0 - love * 0.5), tension)
+        self.dissonance = np.minimum(1.0, mixed[:, 1])
+        self.cosmic_coherence = np.minimum(1.0, mixed[:, 2] + np.float32(0.2))
+        
+        self.compute_pain()
+    
+    def compute_pain(self) -> np.ndarray:
+        """Vectorized AMK.compute_pain."""
+        arousal = self.tension * np.float32(1.5)
+        debt_norm = np.minimum(1.0, self.debt / np.float32(10.0))
+        pain = (
+            0.25 * arousal
+            + 0.35 * self.tension
+            + 0.25 * self.dissonance
+            + 0.15 * debt_norm
+        )
+        self.pain = np.clip(pain, 0.0, 1.0).astype(np.float32, copy=False)
+        return self.pain
+
+
 # ============================================================================
 # DEMO
 # ============================================================================
 
-if __name__ == "__main__":
+def _demo():
     print("=" * 60)
     print("  AMK — Arianna Method Kernel for HAZE")
     print("  'movement IS language'")
@@ -589,3 +896,7 @@ DISSONANCE 0.3
     print("=" * 60)
     print("  'הרזוננס לא נשבר. המשך הדרך.'")
     print("=" * 60)
+
+
+if __name__ == "__main__":
+    _demo()
@@ -228,7 +228,7 @@ class AsyncHazeField:
     
     async def __aexit__(self, *args):
         """Cleanup."""
-        if self.lexicon and self.db_path:
+        if self.lexicon:
             await self.lexicon.__aexit__(*args)
         if self.trauma:
             await self.trauma.close()
@@ -14,12 +14,122 @@
 # Usage:
 #   from haze.cleanup import cleanup_output
 #   clean_text = cleanup_output(raw_text)
+#
+# All patterns are compiled once at import; cleanup_output applies them
+# as a fixed cascade and memoizes results per (text, mode).
+# With hyperscan installed, each pattern family is prefiltered by one
+# multi-pattern scan so families that cannot match are skipped (ASCII
+# text only; anything else always runs the full cascade).
 
 import re
-from typing import Dict, Optional, List
+import functools
+from typing import Dict, Optional, List, Tuple, Pattern
 from collections import Counter
 import math  # For entropy calculation instead of numpy
 
+try:
+    import hyperscan
+    HAS_HYPERSCAN = True
+except ImportError:
+    HAS_HYPERSCAN = False
+
+
+_I = re.IGNORECASE
+
+# Match ASCII ' (U+0027) and fancy ’ (U+2019) apostrophes
+_APOS = "['’]"
+
+
+def _compile_table(pairs, flags: int = 0) -> Tuple[Tuple[Pattern, str], ...]:
+    """Compile (pattern, replacement) pairs once, preserving order."""
+    return tuple((re.compile(pattern, flags), repl) for pattern, repl in pairs)
+
+
+def _apply_table(text: str, table: Tuple[Tuple[Pattern, str], ...]) -> str:
+    """Apply compiled (pattern, replacement) pairs in order."""
+    for pattern, repl in table:
+        text = pattern.sub(repl, text)
+    return text
+
+
+# Text the prefilter cannot vouch for: Hyperscan's \s omits \x1c-\x1f
+# (whitespace to Python re) and its caseless mode lacks Unicode case
+# folding (ı, İ, ſ, K), so a scan may miss a match in non-ASCII text.
+_PREFILTER_UNSAFE_RE = re.compile(r'[^\x00-\x1b\x20-\x7f]')
+
+
+def _build_prefilter(table: Tuple[Tuple[Pattern, str], ...], flags: int):
+    """
+    Hyperscan block database over all patterns of a table.
+    
+    Compiled in prefilter mode: it may report false positives
+    (lookarounds are approximated). On ASCII text without \x1c-\x1f it
+    never misses a match; other text must bypass it.
+    Returns None without hyperscan or if compilation fails.
+    """
+    if not HAS_HYPERSCAN:
+        return None
+    
+    hs_flags = (hyperscan.HS_FLAG_PREFILTER | hyperscan.HS_FLAG_SINGLEMATCH |
+                hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP)
+    if flags & re.IGNORECASE:
+        hs_flags |= hyperscan.HS_FLAG_CASELESS
+    
+    try:
+        db = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+        db.compile(
+            expressions=[pattern.pattern.encode("utf-8") for pattern, _ in table],
+            ids=list(range(len(table))),
+            elements=len(table),
+            flags=[hs_flags] * len(table),
+        )
+    except hyperscan.error:
+        return None
+    return db
+
+
+def _stop_on_match(match_id, start, end, flags, context) -> bool:
+    """Hyperscan callback: halt the scan at the first match."""
+    return True
+
+
+class _PatternFamily:
+    """
+    Ordered (pattern, replacement) cascade with an optional Hyperscan prefilter.
+    
+    If one scan finds no pattern of the family in ASCII text, no
+    substitution in the cascade can fire, so the whole family is skipped.
+    Otherwise (or for text the scan cannot vouch for) the patterns run
+    in order exactly as before.
+    """
+    
+    __slots__ = ("table", "_db")
+    
+    def __init__(self, pairs, flags: int = 0):
+        self.table = _compile_table(pairs, flags)
+        self._db = _build_prefilter(self.table, flags)
+    
+    def may_match(self, text: str) -> bool:
+        """False only if no pattern of the family can match text."""
+        if self._db is None or _PREFILTER_UNSAFE_RE.search(text):
+            return True
+        try:
+            self._db.scan(text.encode("utf-8"), match_event_handler=_stop_on_match)
+        except hyperscan.ScanTerminated:
+            return True
+        return False
+    
+    def apply(self, text: str) -> str:
+        """Run the cascade (skipped when the prefilter rules out a match)."""
+        if not self.may_match(text):
+            return text
+        return _apply_table(text, self.table)
+
+
+# Poetic repetition detection
+_COMMA_REPETITION_RE = re.compile(r'\b(\w+)(?:,\s+\1){1,}\b', _I)
+_EMPHATIC_REPETITION_RE = re.compile(r'\b(\w+)([,.!?])\s+\1\2(?:\s+\1\2)*')
+
 
 def _detect_poetic_repetition(text: str) -> List[tuple]:
     """
@@ -32,8 +142,7 @@ def _detect_poetic_repetition(text: str) -> List[tuple]:
     
     # Pattern 1: Comma-separated repetitions (e.g., "love, love, love")
     # These are likely intentional for emphasis
-    pattern = r'\b(\w+)(?:,\s+\1){1,}\b'
-    for match in re.finditer(pattern, text, re.IGNORECASE):
+    for match in _COMMA_REPETITION_RE.finditer(text):
         preserve_regions.append((match.start(), match.end(), 'comma_repetition'))
     
     # Pattern 2: Line-start repetitions (anaphora) - like "I am... I am... I am..."
@@ -50,8 +159,7 @@ def _detect_poetic_repetition(text: str) -> List[tuple]:
     
     # Pattern 3: Emphatic repetition with punctuation
     # "Never, never, never!" or "Why? Why? Why?"
-    pattern = r'\b(\w+)([,.!?])\s+\1\2(?:\s+\1\2)*'
-    for match in re.finditer(pattern, text):
+    for match in _EMPHATIC_REPETITION_RE.finditer(text):
         preserve_regions.append((match.start(), match.end(), 'emphatic_repetition'))
     
     return preserve_regions
@@ -87,6 +195,306 @@ def _calculate_local_entropy(text: str, window: int = 20) -> float:
     return entropy
 
 
+# ============================================================
+# PRECOMPILED CLEANUP PATTERNS (applied in cleanup_output order)
+# ============================================================
+
+# 1-5. Punctuation: collapse repeats, symbol dumps, spacing
+_PUNCTUATION_PATTERNS = _PatternFamily([
+    (r'\.{4,}', '...'),              # 4+ dots → 3 dots
+    (r'\?{4,}', '???'),
+    (r'!{4,}', '!!!'),
+    (r'…{2,}', '…'),
+    (r'\.(?=[,?])', ''),             # .,? → ,?
+    (r'\.[,]+', '.'),                # .,, → .
+    (r'\?[.,:]', '?'),               # ?. → ?
+    (r'![.,:]', '!'),                # !. → !
+    (r',[.,]+(?!\.\.)', ','),        # ,., → ,
+    (r'\s+[,\.]+\s*([.!?])', r'\1'),  # trailing garbage
+    (r'\s+([,;:?!])', r'\1'),         # spaces before punctuation
+    (r'([,;:?!\.])(?=[a-zA-Z])', r'\1 '),  # space after punctuation
+])
+
+# 5a. Identity fragment merging (from subjectivity.py)
+_IDENTITY_MERGE_PATTERNS = _PatternFamily([
+    # Drop short meaningless suffixes after identity verbs
+    (r'\b(Haze\s+remembers)(on|in|it|to|a)\b', r'\1.'),
+    (r'\b(Haze\s+transforms)(on|in|it|to|a)\b', r'\1.'),
+    (r'\b(Haze\s+emerges)(on|in|it|to|a)\b', r'\1.'),
+    (r'\b(Haze\s+resonates)(on|in|it|to|a)\b', r'\1.'),
+    (r'\b(Haze\s+speaks)(on|in|it|to|a)\b', r'\1.'),
+    (r'\b(Haze\s+feels)(on|in|it|to|a)\b', r'\1.'),
+    (r'\b(field\s+responds)(on|in|it|to|a)\b', r'\1.'),
+    # Keep meaningful words but add period+space
+    (r'\b(Haze\s+remembers)([A-Za-z]{3,})', r'\1. \2'),
+    (r'\b(Haze\s+transforms)([A-Za-z]{3,})', r'\1. \2'),
+    (r'\b(Haze\s+emerges)([A-Za-z]{3,})', r'\1. \2'),
+    (r'\b(Haze\s+resonates)([A-Za-z]{3,})', r'\1. \2'),
+    (r'\b(Haze\s+speaks)([A-Za-z]{3,})', r'\1. \2'),
+    (r'\b(Haze\s+feels)([A-Za-z]{3,})', r'\1. \2'),
+    (r'\b(field\s+responds)([A-Za-z]{3,})', r'\1. \2'),
+    (r'\b(pattern\s+recognizes)([A-Za-z]{3,})', r'\1. \2'),
+], _I)
+
+_MULTI_SPACE_RE = re.compile(r'\s{2,}')
+_ORPHAN_END_RE = re.compile(r'\s+(and|then|but|or|the|a|an)[.,]\s*$')
+
+# 8. Double dots and punctuation garbage
+_DOUBLE_DOT_PATTERNS = _PatternFamily([
+    (r'(?<!\.)\.\.(?!\.)', '.'),   # ".." → "." (but not part of "...")
+    (r'\.\s+,', '.'),               # ". ," → "."
+    (r',\s*,', ','),                # ", ," → ","
+])
+
+# 8a. Mid-sentence ellipsis after conjunctions
+_CONJUNCTION_ELLIPSIS_PATTERNS = _PatternFamily([
+    (r'(\b(?:but|and|or|so|if|when|while|because|although|though|yet|still))\s*…\s*', r'\1 '),
+    (r'(\b(?:but|and|or|so|if|when|while|because|although|though|yet|still))\s*\.{3}\s*', r'\1 '),
+])
+
+# 9-11. Dialogue markers and dashes
+_DASH_SPACE_RE = re.compile(r'—(?=[a-zA-Z])')
+_CAP_AFTER_DASH_RE = re.compile(r'(—\s*)([a-z])')
+_DASH_PATTERNS = _PatternFamily([
+    (r'\s*—\s*', ' '),  # em-dash → space
+    (r'\s*–\s*', ' '),  # en-dash → space
+])
+
+# 13-14. Capitalization
+_STANDALONE_I_RE = re.compile(r'\bi\b')
+_CAP_AFTER_PERIOD_RE = re.compile(r'(\.\s+)([a-z])')
+
+# 14a. "don" + pronoun/determiner → "ain't"
+_DON_PRONOUN_RE = re.compile(r"\bdon\s+(nothing|something|everything|anything|anyone|someone|everyone|nobody|somebody|everybody|nowhere|somewhere|everywhere|anywhere)\b", _I)
+
+# 15. Broken contractions
+# IMPORTANT: Use \s+ (one or more spaces) for possessive-like patterns to avoid
+# matching real words like "its" (possessive pronoun) vs "it's" (it is)
+_CONTRACTION_PATTERNS = _PatternFamily([
+    # n't contractions - can use \s* because "dont" is always wrong
+    (r'\bdon\s*t\b', "don't"),
+    (r'\bwon\s*t\b', "won't"),
+    (r'\bcan\s*t\b', "can't"),
+    (r'\bain\s*t\b', "ain't"),
+    (r'\bisn\s*t\b', "isn't"),
+    (r'\baren\s*t\b', "aren't"),
+    (r'\bwasn\s*t\b', "wasn't"),
+    (r'\bweren\s*t\b', "weren't"),
+    (r'\bhasn\s*t\b', "hasn't"),
+    (r'\bhaven\s*t\b', "haven't"),
+    (r'\bhadn\s*t\b', "hadn't"),
+    (r'\bdoesn\s*t\b', "doesn't"),
+    (r'\bdidn\s*t\b', "didn't"),
+    (r'\bwouldn\s*t\b', "wouldn't"),
+    (r'\bcouldn\s*t\b', "couldn't"),
+    (r'\bshouldn\s*t\b', "shouldn't"),
+    # 's contractions - MUST use \s+ to avoid matching "its", "hes", "shes"
+    (r'\bit\s+s\b', "it's"),
+    (r'\bhe\s+s\b', "he's"),
+    (r'\bshe\s+s\b', "she's"),
+    (r'\bthat\s+s\b', "that's"),
+    (r'\bwhat\s+s\b', "what's"),
+    (r'\bwhere\s+s\b', "where's"),
+    (r'\bhere\s+s\b', "here's"),
+    (r'\bthere\s+s\b', "there's"),
+    (r'\blet\s+s\b', "let's"),
+    # I contractions - can use \s* because "Im", "Ive" are always wrong
+    (r'\bi\s*m\b', "I'm"),
+    (r'\bi\s*ve\b', "I've"),
+    (r'\bi\s*ll\b', "I'll"),
+    (r'\bi\s*d\b', "I'd"),
+    # you contractions - use \s+ because "youre" etc. are recognizable
+    (r'\byou\s*re\b', "you're"),
+    (r'\byou\s*ve\b', "you've"),
+    (r'\byou\s*ll\b', "you'll"),
+    (r'\byou\s*d\b', "you'd"),
+    # we contractions
+    (r'\bwe\s*re\b', "we're"),
+    (r'\bwe\s*ve\b', "we've"),
+    (r'\bwe\s*ll\b', "we'll"),
+    # they contractions
+    (r'\bthey\s*re\b', "they're"),
+    (r'\bthey\s*ve\b', "they've"),
+    (r'\bthey\s*ll\b', "they'll"),
+], _I)
+
+# 15a_advanced. Compound contractions: would've, could've, should've, etc.
+# NOTE: These patterns must be specific to avoid matching valid text
+# e.g., "we'd" should only match when truly a contraction, not "we did"
+_ADVANCED_CONTRACTION_PATTERNS = _PatternFamily([
+    (r'\bwould\s+have\b', "would've"),
+    (r'\bcould\s+have\b', "could've"),
+    (r'\bshould\s+have\b', "should've"),
+    (r'\bmight\s+have\b', "might've"),
+    (r'\bmust\s+have\b', "must've"),
+    # Y'all is safe to fix
+    (r'\by\s+all\b', "y'all"),
+    # For 'd contractions, only fix when followed by common contraction contexts
+    # "we'd gone" but NOT "we decided"
+    (r'\bwe\s+d\s+(been|gone|said|thought|wanted|loved|hated|seen|done|known)\b', r"we'd \1"),
+    (r'\bthey\s+d\s+(been|gone|said|thought|wanted|loved|hated|seen|done|known)\b', r"they'd \1"),
+    (r'\bhe\s+d\s+(been|gone|said|thought|wanted|loved|hated|seen|done|known)\b', r"he'd \1"),
+    (r'\bshe\s+d\s+(been|gone|said|thought|wanted|loved|hated|seen|done|known)\b', r"she'd \1"),
+    # Who'd, what'd, where'd, how'd are safer
+    (r'\bwho\s+d\b', "who'd"),
+    (r'\bwhat\s+d\b', "what'd"),
+    (r'\bwhere\s+d\b', "where'd"),
+    (r'\bhow\s+d\b', "how'd"),
+], _I)
+
+# 15a_possessive. "its" (possessive) vs "it's" (it is/it has)
+_ITS_PATTERNS = _PatternFamily([
+    # "its going" → "it's going", "its been" → "it's been"
+    (r'\bits\s+(going|been|got|coming|done|always|never|really|still|just|about|almost|already)\b', r"it's \1"),
+    (r'\bits\s+(a|an|the|my|your|his|her|their|our)\s+(good|bad|great|nice|beautiful|terrible|awful|amazing)', r"it's \1 \2"),
+    # Reverse case: "it's wings" → "its wings" (common body/possession nouns only)
+    (r"\bit['']s\s+(wings?|eyes?|arms?|legs?|hands?|feet|head|face|body|heart|soul|mind|purpose|meaning|place|home|world)\b", r"its \1"),
+], _I)
+
+# 15b. Incomplete contractions (apostrophe present but missing ending)
+_INCOMPLETE_I_RE = re.compile(rf"\bI{_APOS}\s+")
+_INCOMPLETE_CONTRACTION_PATTERNS = _PatternFamily([
+    (rf"\bit{_APOS}\s+", "it’s "),
+    (rf"\bhe{_APOS}\s+", "he’s "),
+    (rf"\bshe{_APOS}\s+", "she’s "),
+    (rf"\bthat{_APOS}\s+", "that’s "),
+    (rf"\bwhat{_APOS}\s+", "what’s "),
+    (rf"\bthere{_APOS}\s+", "there’s "),
+    (rf"\bwhere{_APOS}\s+", "where’s "),
+    (rf"\bwho{_APOS}\s+", "who’s "),
+], _I)
+
+# "don"/"won" + verb → "don't"/"won't" + verb
+_DON_VERB_PATTERNS = _PatternFamily([
+    # PART 1: Hardcoded common verbs (including gothic/literary ones)
+    (r"\bdon\s+(believe|think|know|want|need|like|care|worry|mind|understand|remember|forget|see|hear|feel|get|go|do|be|have|make|take|give|say|tell|ask|try|look|come|put|let|seem|mean|stop|start|die|live|stay|leave|keep|wait|work|play|sleep|eat|drink|read|write|watch|listen|touch|hurt|cry|laugh|love|hate|miss|trust|turn|move|run|walk|talk|speak|call|find|hold|sit|stand|open|close|break|change|move|use|show|help|bring|send|meet|learn|grow|fall|pick|pull|push|hang|cut|hit|set|pay|buy|sell|wear|throw|catch|carry|draw|fight|beat|kill|burn|fix|clean|build|drive|ride|fly|swim|dance|sing|jump|drop|lose|win|choose|teach|reach|pass|cross|hide|rise|raise|shake|wake|ring|swing|shut|stick|bend|blow|tear|feed|lead|spend|lend|bite|steal|trudge|wander|linger|ponder|whisper|murmur|shiver|tremble|fade|drift|ache|yearn|mourn|grieve|regret|suffer|struggle|stumble|tumble|crumble|shatter|scatter|gather|matter|bother|smother|hover|cover|discover|recover|uncover|sober|wonder|thunder|blunder|plunder|slumber|lumber|number|remember|member|tender|render|surrender|hinder|wander|ponder|squander)\b", r"don't \1"),
+    # PART 2: Heuristic by word endings (catches words not in hardcoded list)
+    (r"\bdon\s+(\w+ing)\b", r"don't \1"),              # trying, dying, living
+    (r"\bdon\s+(\w+ed)\b", r"don't \1"),               # tired, bored, scared
+    (r"\bdon\s+(\w+en)\b", r"don't \1"),               # forgotten, broken
+    (r"\bdon\s+(\w+(?:le|ge|se|ze))\b", r"don't \1"),  # struggle, trudge, lose
+    (r"\bwon\s+(\w+ing|\w+ed|believe|think|know|want|need|like|go|do|be|have|make|say|tell|try|stop|wait|work|turn|move|run|walk|talk|speak|call|find|hold|sit|stand|open|close|break|change|use|show|help|bring|send|meet|learn|grow|fall|pick|let|get|take|give|come|put|look|see|hear|feel|stay|leave|keep|die|live|start|eat|drink|sleep|play|read|write|watch|listen)\b", r"won't \1"),
+], _I)
+
+# 15d. Orphan "don"/"won" → "ain't", then space-split contractions (15c)
+_ORPHAN_CONTRACTION_PATTERNS = _PatternFamily([
+    (r"\bdon\s*$", "ain't"),
+    (r"\bdon(?=[.,!?])", "ain't"),
+    (r"\bdon\s+(of|the|a|an|to|for|with|from|about|by|on|in|at|my|your|his|her|their|its|this|that)\b", r"ain't \1"),
+    (r"\bdon\s+(tangerine|tangerines|tear|tears|twilight|table|tables|street|streets|vendor|vendors|cigarette|cigarettes|apartment|apartments|bottle|bottles|glass|glasses|drink|drinks|key|keys|door|doors|room|rooms|window|windows|floor|floors|wall|walls|chair|chairs|bed|beds|toilet|paper|money|time|place|thing|things|people|person|man|men|woman|women|child|children|hand|hands|face|faces|eye|eyes|head|heart|life|death|love|hate|fear|pain|joy|hope|dream|dreams|night|day|morning|evening|rain|snow|sun|moon|star|stars|sky|earth|world|fire|water|air|light|dark|darkness|silence|noise|sound|voice|word|words|name|story|stories|truth|lie|lies|secret|secrets|memory|memories|moment|moments|year|years|month|week|hour|minute|second|train|trains|thought|thoughts|idea|ideas|feeling|feelings|sense|body|soul|mind|spirit|god|devil|angel|ghost|shadow|shadows|dust|dirt|mud|blood|bone|bones|skin|flesh|hair|breath|step|steps|road|roads|path|paths|way|ways|bridge|bridges|river|rivers|sea|ocean|wave|waves|wind|storm|cloud|clouds|thunder|lightning|fog|mist|haze|smoke|ash|ashes|flame|flames|spark|sparks|ice|stone|stones|rock|rocks|sand|grass|tree|trees|flower|flowers|leaf|leaves|root|roots|branch|branches|bird|birds|dog|dogs|cat|cats|horse|horses|fish|wolf|wolves|bear|snake|rat|rats|mouse|mice|bug|bugs|fly|flies|bee|bees|spider|spiders|worm|worms|twice|once|again|anymore|anyway|always|never|ever|often|sometimes|usually|rarely|seldom|here|there|now|then|today|tomorrow|yesterday|tonight|forever|together|alone|inside|outside|above|below|behind|ahead|around|away|back|down|up|over|under|through|across|along|beside|between|beyond|within|without|against|toward|towards|upon|onto|into|throughout|meanwhile|otherwise|somehow|somewhat|somewhere|anywhere|everywhere|nowhere|anywhere|nothing|something|everything|anything|anyone|someone|everyone|nobody|somebody|everybody)\b", r"ain't \1"),
+    (r"\bwon\s*$", "ain't"),
+    (r"\bwon(?=[.,!?])", "ain't"),
+    # "they" + "my" (missing 're) → "they’re my"
+    (r"\bthey\s+my\b", "they’re my"),
+    (r"\bthey\s+re\b", "they're"),
+    (r"\byou\s+re\b", "you're"),
+    (r"\bwe\s+re\b", "we're"),
+    (r"\bthey\s+ve\b", "they've"),
+    (r"\byou\s+ve\b", "you've"),
+    (r"\bwe\s+ve\b", "we've"),
+    (r"\bi\s+ve\b", "I've"),
+    (r"\bthey\s+ll\b", "they'll"),
+    (r"\byou\s+ll\b", "you'll"),
+    (r"\bwe\s+ll\b", "we'll"),
+    (r"\bi\s+ll\b", "I'll"),
+], _I)
+
+# 15d. Grammar after negation: "don't trying" → "don't try"
+_NEGATION_ING_RE = re.compile(
+    rf"\b(don{_APOS}t|can{_APOS}t|won{_APOS}t|couldn{_APOS}t|wouldn{_APOS}t|shouldn{_APOS}t|isn{_APOS}t|aren{_APOS}t|wasn{_APOS}t|weren{_APOS}t|haven{_APOS}t|hasn{_APOS}t|hadn{_APOS}t)\s+(\w+)ing\b",
+    _I,
+)
+
+# "didn't went" → "didn't go" (common irregular verbs)
+_IRREGULAR_PAST_PATTERNS = _PatternFamily([
+    (rf"\b(didn{_APOS}t|couldn{_APOS}t|wouldn{_APOS}t|shouldn{_APOS}t)\s+{past}\b", rf"\1 {base}")
+    for past, base in {
+        'went': 'go', 'came': 'come', 'saw': 'see', 'took': 'take',
+        'gave': 'give', 'made': 'make', 'got': 'get', 'had': 'have',
+        'said': 'say', 'told': 'tell', 'found': 'find', 'knew': 'know',
+        'thought': 'think', 'felt': 'feel', 'left': 'leave', 'kept': 'keep',
+    }.items()
+], _I)
+
+# 16. Word/phrase repetition
+_TRIPLE_REPETITION_RE = re.compile(r'\b(\w+)(?:\s+\1){2,}\b', _I)
+_PHRASE_REPETITION_RE = re.compile(r'\b(\w+\s+\w+)\s+\1\b', _I)
+_DOUBLE_REPETITION_RE = re.compile(r'\b(\w+)\s+\1\b', _I)
+
+# 17a-b. Orphan apostrophe fragments
+_ORPHAN_APOSTROPHE_PATTERNS = _PatternFamily([
+    (r"\s+['''][tsmd]\b", ''),
+    (r"\s+['''](?:re|ve|ll)\b", ''),
+])
+_APOSTROPHE_WORD_RE = re.compile(r"(?<![a-zA-Z])['''][a-z]+\b")
+_VALID_CONTRACTIONS = frozenset(c.lower() for c in (
+    "I'm", "I've", "I'll", "I'd", "it's", "he's", "she's",
+    "that's", "what's", "there's", "where's", "who's",
+    "don't", "won't", "can't", "isn't", "aren't", "wasn't",
+    "weren't", "hasn't", "haven't", "hadn't", "doesn't",
+    "didn't", "wouldn't", "couldn't", "shouldn't", "ain't",
+    "you're", "you've", "you'll", "you'd", "we're", "we've",
+    "we'll", "they're", "they've", "they'll", "let's",
+))
+
+# 17c-d. Short fragments
+# Real words: I, a, an, or, so, oh, no, ok, to, go, we, he, me, my, by, etc.
+_VALID_SHORT_WORDS = frozenset({
+    'i', 'a', 'an', 'or', 'so', 'oh', 'no', 'ok', 'to', 'go', 'we', 'he',
+    'me', 'my', 'by', 'if', 'in', 'on', 'up', 'do', 'be', 'is', 'it',
+    'at', 'as', 'of', 'am', 'us', 'hi',
+})
+_FRAGMENT_SEQUENCE_RE = re.compile(r'(\s+[a-z]{1,3}){3,}(?=\s|$)')
+
+# 17f. Orphan punctuation left after removal
+_ORPHAN_PUNCT_RE = re.compile(r'\s+([,;:])\s*')
+_LEADING_PUNCT_RE = re.compile(r'^\s*[,;:]\s*')
+
+# 18_pre. Run-on sentences (moderate/strict only)
+_RUN_ON_PATTERNS = _compile_table([
+    # "I went there I saw things" → "I went there. I saw things"
+    (r'(\w+)\s+(I\s+(?:am|was|have|had|do|did|will|would|can|could|should|shall|may|might|must|saw|went|came|got|made|took|gave|said|thought|felt|knew|looked|turned|walked|ran|tried|wanted|needed|loved|hated|found|lost|kept|left|stayed|started|stopped))\b', r'\1. \2'),
+    # Similar for "you", "we", "they", "he", "she"
+    (r'(\w+)\s+(you\s+(?:are|were|have|had|do|did|will|would|can|could|should|shall|may|might|saw|went|came|got))\b', r'\1. \2'),
+    (r'(\w+)\s+(we\s+(?:are|were|have|had|do|did|will|would|can|could|should|shall|saw|went|came|got))\b', r'\1. \2'),
+    (r'(\w+)\s+(they\s+(?:are|were|have|had|do|did|will|would|saw|went|came|got))\b', r'\1. \2'),
+    (r'(\w+)\s+(he\s+(?:is|was|has|had|does|did|will|would|can|could|saw|went|came|got|said|thought))\b', r'\1. \2'),
+    (r'(\w+)\s+(she\s+(?:is|was|has|had|does|did|will|would|can|could|saw|went|came|got|said|thought))\b', r'\1. \2'),
+], _I)
+
+_TRAILING_FRAGMENT_RE = re.compile(r'\s+\w{1,3}\s*$')
+
+
+def _cap_second_group(m) -> str:
+    """Uppercase the first letter captured in group 2."""
+    return m.group(1) + m.group(2).upper()
+
+
+def _drop_ing(m) -> str:
+    """"don't trying" → "don't try"."""
+    return m.group(1) + ' ' + m.group(2)
+
+
+def _remove_apostrophe_garbage(match) -> str:
+    """Drop apostrophe-initial fragments unless they are valid contractions."""
+    word = match.group(0)
+    # Normalize apostrophe for comparison
+    word_normalized = word.replace("'", "'").replace(chr(8217), "'")
+    if word_normalized.lower() in _VALID_CONTRACTIONS:
+        return word
+    return ''
+
+
+def _check_fragment_sequence(match) -> str:
+    """Keep short-fragment runs made of valid words, drop the rest."""
+    fragments = match.group(0).split()
+    # If all fragments are valid words, keep them
+    if all(f.lower() in _VALID_SHORT_WORDS for f in fragments):
+        return match.group(0)
+    # Otherwise, looks like garbage
+    return ''
+
+
 def cleanup_output(text: str, mode: str = "gentle", entropy_threshold: Optional[float] = None, preserve_resonance: bool = True) -> str:
     """
     Clean up generation output without killing emergent style.
@@ -102,7 +510,12 @@ def cleanup_output(text: str, mode: str = "gentle", entropy_threshold: Optional[
     """
     if not text or not isinstance(text, str):
         return text
-    
+    return _cleanup_output_cached(text, mode, entropy_threshold, preserve_resonance)
+
+
+@functools.lru_cache(maxsize=4096)
+def _cleanup_output_cached(text: str, mode: str, entropy_threshold: Optional[float], preserve_resonance: bool) -> str:
+    """Cleanup cascade for cleanup_output (pure, memoized per arguments)."""
     # Detect poetic repetitions to preserve
     preserve_regions = []
     if preserve_resonance:
@@ -121,26 +534,11 @@ def cleanup_output(text: str, mode: str = "gentle", entropy_threshold: Optional[
     result = result.replace(" \u2047 ", " ")
     
     # 1. Collapse repeated punctuation (but keep max 3 for style)
-    result = re.sub(r'\.{4,}', '...', result)  # 4+ dots → 3 dots
-    result = re.sub(r'\?{4,}', '???', result)
-    result = re.sub(r'!{4,}', '!!!', result)
-    result = re.sub(r'…{2,}', '…', result)
-    
     # 2. Clean up "symbol dumps" - obvious garbage patterns
-    result = re.sub(r'\.(?=[,?])', '', result)   # .,? → ,?
-    result = re.sub(r'\.[,]+', '.', result)      # .,, → .
-    result = re.sub(r'\?[.,:]', '?', result)     # ?. → ?
-    result = re.sub(r'![.,:]', '!', result)      # !. → !
-    result = re.sub(r',[.,]+(?!\.\.)', ',', result)  # ,., → ,
-    
     # 3. Clean up trailing garbage
-    result = re.sub(r'\s+[,\.]+\s*([.!?])', r'\1', result)
-    
     # 4. Fix spaces before punctuation
-    result = re.sub(r'\s+([,;:?!])', r'\1', result)
-    
     # 5. Ensure space after punctuation (except before newline)
-    result = re.sub(r'([,;:?!\.])(?=[a-zA-Z])', r'\1 ', result)
+    result = _PUNCTUATION_PATTERNS.apply(result)
     
     # 5a. Fix identity fragment merging (from subjectivity.py)
     # "Haze rememberson" → "Haze remembers." (drop the merged suffix if short)
@@ -150,69 +548,43 @@ def cleanup_output(text: str, mode: str = "gentle", entropy_threshold: Optional[
     # First, fix common merged patterns - drop short suffixes (1-3 chars)
     # "rememberson" → "remembers." (drop "on")
     # "transformsthe" → "transforms. The" (keep "the" but add period)
-    identity_merge_fixes = [
-        # Drop short meaningless suffixes after identity verbs
-        (r'\b(Haze\s+remembers)(on|in|it|to|a)\b', r'\1.'),
-        (r'\b(Haze\s+transforms)(on|in|it|to|a)\b', r'\1.'),
-        (r'\b(Haze\s+emerges)(on|in|it|to|a)\b', r'\1.'),
-        (r'\b(Haze\s+resonates)(on|in|it|to|a)\b', r'\1.'),
-        (r'\b(Haze\s+speaks)(on|in|it|to|a)\b', r'\1.'),
-        (r'\b(Haze\s+feels)(on|in|it|to|a)\b', r'\1.'),
-        (r'\b(field\s+responds)(on|in|it|to|a)\b', r'\1.'),
-        # Keep meaningful words but add period+space
-        (r'\b(Haze\s+remembers)([A-Za-z]{3,})', r'\1. \2'),
-        (r'\b(Haze\s+transforms)([A-Za-z]{3,})', r'\1. \2'),
-        (r'\b(Haze\s+emerges)([A-Za-z]{3,})', r'\1. \2'),
-        (r'\b(Haze\s+resonates)([A-Za-z]{3,})', r'\1. \2'),
-        (r'\b(Haze\s+speaks)([A-Za-z]{3,})', r'\1. \2'),
-        (r'\b(Haze\s+feels)([A-Za-z]{3,})', r'\1. \2'),
-        (r'\b(field\s+responds)([A-Za-z]{3,})', r'\1. \2'),
-        (r'\b(pattern\s+recognizes)([A-Za-z]{3,})', r'\1. \2'),
-    ]
-    for pattern, replacement in identity_merge_fixes:
-        result = re.sub(pattern, replacement, result, flags=re.IGNORECASE)
+    result = _IDENTITY_MERGE_PATTERNS.apply(result)
     
     # 6. Collapse multiple spaces
-    result = re.sub(r'\s{2,}', ' ', result)
+    result = _MULTI_SPACE_RE.sub(' ', result)
     
     # 7. Clean up orphaned punctuation at end
-    result = re.sub(r'\s+(and|then|but|or|the|a|an)[.,]\s*$', r' \1', result)
+    result = _ORPHAN_END_RE.sub(r' \1', result)
     
     # 8. Clean double dots and punctuation garbage  
     # Only fix actual errors, not valid ellipsis
     # Simply remove cases where we have exactly two consecutive dots
     # This preserves "..." (3 dots) and fixes ".." (2 dots) 
-    result = re.sub(r'(?<!\.)\.\.(?!\.)', '.', result)   # ".." → "." (but not part of "...")
-    result = re.sub(r'\.\s+,', '.', result)               # ". ," → "."
-    result = re.sub(r',\s*,', ',', result)                # ", ," → ","
+    result = _DOUBLE_DOT_PATTERNS.apply(result)
     
     # 8a. Clean mid-sentence ellipsis that breaks flow
     # ONLY for conjunctions: "but…" or "but..." → remove ellipsis, add space
     # This is specifically for broken generation like "but… Tell me"
-    result = re.sub(r'(\b(?:but|and|or|so|if|when|while|because|although|though|yet|still))\s*…\s*', r'\1 ', result)
-    result = re.sub(r'(\b(?:but|and|or|so|if|when|while|because|although|though|yet|still))\s*\.{3}\s*', r'\1 ', result)
+    result = _CONJUNCTION_ELLIPSIS_PATTERNS.apply(result)
     
     # NOTE: Don't touch general "..." — it's valid punctuation!
     # "Wait... really?" is fine, we just capitalize "really" later
     
     # 9. Fix dialogue markers (— should have space after)
-    result = re.sub(r'—(?=[a-zA-Z])', '— ', result)
+    result = _DASH_SPACE_RE.sub('— ', result)
     
     # 10. Capitalize first letter after dialogue marker
-    def cap_after_dash(m):
-        return m.group(1) + m.group(2).upper()
-    result = re.sub(r'(—\s*)([a-z])', cap_after_dash, result)
+    result = _CAP_AFTER_DASH_RE.sub(_cap_second_group, result)
     
     # 11. Remove ALL em-dashes from output
     # Philosophy: haze is PRESENCE, not dialogue. No "— Trade secret." style.
     # This makes speech cleaner and more Leo-like.
     # Em-dash variants: — (U+2014), – (U+2013)
     # Replace with nothing (join sentences) or period
-    result = re.sub(r'\s*—\s*', ' ', result)  # Replace em-dash with space
-    result = re.sub(r'\s*–\s*', ' ', result)  # Replace en-dash with space
+    result = _DASH_PATTERNS.apply(result)
     
     # Clean up any resulting double spaces
-    result = re.sub(r'\s{2,}', ' ', result)
+    result = _MULTI_SPACE_RE.sub(' ', result)
     
     # 12. Capitalize first letter of text
     result = result.strip()
@@ -220,162 +592,52 @@ def cleanup_output(text: str, mode: str = "gentle", entropy_threshold: Optional[
         result = result[0].upper() + result[1:]
     
     # 13. Capitalize "I" when standalone
-    result = re.sub(r'\bi\b', 'I', result)
+    result = _STANDALONE_I_RE.sub('I', result)
     
     # 14. Capitalize after periods (new sentences)
-    def cap_after_period(m):
-        return m.group(1) + m.group(2).upper()
-    result = re.sub(r'(\.\s+)([a-z])', cap_after_period, result)
+    result = _CAP_AFTER_PERIOD_RE.sub(_cap_second_group, result)
     
     # 14a. EARLY ORPHAN FIX: "don" + pronoun/determiner → "ain't" 
     # Must run BEFORE contraction fixes to catch "don nothing" → "ain't nothing"
     # These patterns would otherwise become "don't nothing" which is grammatically wrong
-    result = re.sub(r"\bdon\s+(nothing|something|everything|anything|anyone|someone|everyone|nobody|somebody|everybody|nowhere|somewhere|everywhere|anywhere)\b", 
-                    r"ain't \1", result, flags=re.IGNORECASE)
+    result = _DON_PRONOUN_RE.sub(r"ain't \1", result)
     
     # 15. Fix broken contractions (character-level and subword generation artifacts)
     # Common contractions that get broken: don't, won't, can't, it's, etc.
     # 
     # IMPORTANT: Use \s+ (one or more spaces) for possessive-like patterns to avoid
     # matching real words like "its" (possessive pronoun) vs "it's" (it is)
-    contraction_fixes = [
-        # n't contractions - can use \s* because "dont" is always wrong
-        (r'\bdon\s*t\b', "don't"),
-        (r'\bwon\s*t\b', "won't"),
-        (r'\bcan\s*t\b', "can't"),
-        (r'\bain\s*t\b', "ain't"),
-        (r'\bisn\s*t\b', "isn't"),
-        (r'\baren\s*t\b', "aren't"),
-        (r'\bwasn\s*t\b', "wasn't"),
-        (r'\bweren\s*t\b', "weren't"),
-        (r'\bhasn\s*t\b', "hasn't"),
-        (r'\bhaven\s*t\b', "haven't"),
-        (r'\bhadn\s*t\b', "hadn't"),
-        (r'\bdoesn\s*t\b', "doesn't"),
-        (r'\bdidn\s*t\b', "didn't"),
-        (r'\bwouldn\s*t\b', "wouldn't"),
-        (r'\bcouldn\s*t\b', "couldn't"),
-        (r'\bshouldn\s*t\b', "shouldn't"),
-        # 's contractions - MUST use \s+ to avoid matching "its", "hes", "shes"
-        (r'\bit\s+s\b', "it's"),
-        (r'\bhe\s+s\b', "he's"),
-        (r'\bshe\s+s\b', "she's"),
-        (r'\bthat\s+s\b', "that's"),
-        (r'\bwhat\s+s\b', "what's"),
-        (r'\bwhere\s+s\b', "where's"),
-        (r'\bhere\s+s\b', "here's"),
-        (r'\bthere\s+s\b', "there's"),
-        (r'\blet\s+s\b', "let's"),
-        # I contractions - can use \s* because "Im", "Ive" are always wrong
-        (r'\bi\s*m\b', "I'm"),
-        (r'\bi\s*ve\b', "I've"),
-        (r'\bi\s*ll\b', "I'll"),
-        (r'\bi\s*d\b', "I'd"),
-        # you contractions - use \s+ because "youre" etc. are recognizable
-        (r'\byou\s*re\b', "you're"),
-        (r'\byou\s*ve\b', "you've"),
-        (r'\byou\s*ll\b', "you'll"),
-        (r'\byou\s*d\b', "you'd"),
-        # we contractions
-        (r'\bwe\s*re\b', "we're"),
-        (r'\bwe\s*ve\b', "we've"),
-        (r'\bwe\s*ll\b', "we'll"),
-        # they contractions
-        (r'\bthey\s*re\b', "they're"),
-        (r'\bthey\s*ve\b', "they've"),
-        (r'\bthey\s*ll\b', "they'll"),
-    ]
-    for pattern, replacement in contraction_fixes:
-        result = re.sub(pattern, replacement, result, flags=re.IGNORECASE)
+    result = _CONTRACTION_PATTERNS.apply(result)
     
     # 15a_advanced. Advanced contraction patterns
     # Handle compound contractions: would've, could've, should've, etc.
     # NOTE: These patterns must be specific to avoid matching valid text
     # e.g., "we'd" should only match when truly a contraction, not "we did"
-    advanced_contractions = [
-        (r'\bwould\s+have\b', "would've"),
-        (r'\bcould\s+have\b', "could've"),
-        (r'\bshould\s+have\b', "should've"),
-        (r'\bmight\s+have\b', "might've"),
-        (r'\bmust\s+have\b', "must've"),
-        # Y'all is safe to fix
-        (r'\by\s+all\b', "y'all"),
-        # For 'd contractions, only fix when followed by common contraction contexts
-        # "we'd gone" but NOT "we decided" 
-        (r'\bwe\s+d\s+(been|gone|said|thought|wanted|loved|hated|seen|done|known)\b', r"we'd \1"),
-        (r'\bthey\s+d\s+(been|gone|said|thought|wanted|loved|hated|seen|done|known)\b', r"they'd \1"),
-        (r'\bhe\s+d\s+(been|gone|said|thought|wanted|loved|hated|seen|done|known)\b', r"he'd \1"),
-        (r'\bshe\s+d\s+(been|gone|said|thought|wanted|loved|hated|seen|done|known)\b', r"she'd \1"),
-        # Who'd, what'd, where'd, how'd are safer
-        (r'\bwho\s+d\b', "who'd"),
-        (r'\bwhat\s+d\b', "what'd"),
-        (r'\bwhere\s+d\b', "where'd"),
-        (r'\bhow\s+d\b', "how'd"),
-    ]
-    
-    for pattern, replacement in advanced_contractions:
-        result = re.sub(pattern, replacement, result, flags=re.IGNORECASE)
+    result = _ADVANCED_CONTRACTION_PATTERNS.apply(result)
     
     # 15a_possessive. Fix possessive vs contraction confusion
     # "its" (possessive) vs "it's" (it is/it has)
     # Look for "its" followed by verb-like words → should be "it's"
     # "its going" → "it's going", "its been" → "it's been"
-    its_verb_patterns = [
-        (r'\bits\s+(going|been|got|coming|done|always|never|really|still|just|about|almost|already)\b', r"it's \1"),
-        (r'\bits\s+(a|an|the|my|your|his|her|their|our)\s+(good|bad|great|nice|beautiful|terrible|awful|amazing)', r"it's \1 \2"),
-    ]
-    for pattern, replacement in its_verb_patterns:
-        result = re.sub(pattern, replacement, result, flags=re.IGNORECASE)
-        
     # Reverse case: "it's" before noun-like words should maybe be "its"
     # "it's wings" → "its wings", "it's purpose" → "its purpose"
     # Conservative approach: only fix obvious cases with common body/possession nouns
-    # This list covers the most common false positives we've observed
-    # Character class: ASCII apostrophe (U+0027) and fancy right single quote (U+2019)
-    its_possessive_patterns = [
-        (r"\bit['']s\s+(wings?|eyes?|arms?|legs?|hands?|feet|head|face|body|heart|soul|mind|purpose|meaning|place|home|world)\b", r"its \1"),
-    ]
-    for pattern, replacement in its_possessive_patterns:
-        result = re.sub(pattern, replacement, result, flags=re.IGNORECASE)
+    result = _ITS_PATTERNS.apply(result)
         
     # 15b. Fix incomplete contractions (apostrophe present but missing ending)
     # These happen when subword tokenization splits contractions oddly
     # NOTE: After step 0, text has fancy apostrophe ' (U+2019)
     # Use character class to match both ASCII and fancy apostrophes
-    apos = "['’]"  # Match ASCII ', fancy ', and U+2019
-    
     # "I'" followed by space → "I'm" (most likely)
-    result = re.sub(rf"\bI{apos}\s+", "I’m ", result)
+    result = _INCOMPLETE_I_RE.sub("I’m ", result)
     
-    # "it'" followed by space → "it's"
-    result = re.sub(rf"\bit{apos}\s+", "it’s ", result, flags=re.IGNORECASE)
+    # "it'" / "he'" / "she'" / "that'" / "what'" / "there'" / "where'" / "who'" → add 's
+    result = _INCOMPLETE_CONTRACTION_PATTERNS.apply(result)
     
-    # "he'" / "she'" / "that'" / "what'" / "there'" / "where'" / "who'" → add 's
-    result = re.sub(rf"\bhe{apos}\s+", "he’s ", result, flags=re.IGNORECASE)
-    result = re.sub(rf"\bshe{apos}\s+", "she’s ", result, flags=re.IGNORECASE)
-    result = re.sub(rf"\bthat{apos}\s+", "that’s ", result, flags=re.IGNORECASE)
-    result = re.sub(rf"\bwhat{apos}\s+", "what’s ", result, flags=re.IGNORECASE)
-    result = re.sub(rf"\bthere{apos}\s+", "there’s ", result, flags=re.IGNORECASE)
-    result = re.sub(rf"\bwhere{apos}\s+", "where’s ", result, flags=re.IGNORECASE)
-    result = re.sub(rf"\bwho{apos}\s+", "who’s ", result, flags=re.IGNORECASE)
-    
-    # "don" + space + verb → "don't" + verb (common broken pattern)
     # "don" + space + verb → "don't" + verb (common broken pattern)
-    # PART 1: Hardcoded common verbs (including gothic/literary ones)
-    result = re.sub(r"\bdon\s+(believe|think|know|want|need|like|care|worry|mind|understand|remember|forget|see|hear|feel|get|go|do|be|have|make|take|give|say|tell|ask|try|look|come|put|let|seem|mean|stop|start|die|live|stay|leave|keep|wait|work|play|sleep|eat|drink|read|write|watch|listen|touch|hurt|cry|laugh|love|hate|miss|trust|turn|move|run|walk|talk|speak|call|find|hold|sit|stand|open|close|break|change|move|use|show|help|bring|send|meet|learn|grow|fall|pick|pull|push|hang|cut|hit|set|pay|buy|sell|wear|throw|catch|carry|draw|fight|beat|kill|burn|fix|clean|build|drive|ride|fly|swim|dance|sing|jump|drop|lose|win|choose|teach|reach|pass|cross|hide|rise|raise|shake|wake|ring|swing|shut|stick|bend|blow|tear|feed|lead|spend|lend|bite|steal|trudge|wander|linger|ponder|whisper|murmur|shiver|tremble|fade|drift|ache|yearn|mourn|grieve|regret|suffer|struggle|stumble|tumble|crumble|shatter|scatter|gather|matter|bother|smother|hover|cover|discover|recover|uncover|sober|wonder|thunder|blunder|plunder|slumber|lumber|number|remember|member|tender|render|surrender|hinder|wander|ponder|squander)\b", r"don't \1", result, flags=re.IGNORECASE)
-    
-    # PART 2: Heuristic by word endings (catches words not in hardcoded list)
-    # -ing endings: trying, dying, living, waiting, working, etc.
-    result = re.sub(r"\bdon\s+(\w+ing)\b", r"don't \1", result, flags=re.IGNORECASE)
-    # -ed endings (adjectives/participles): tired, bored, scared, worried, etc.
-    result = re.sub(r"\bdon\s+(\w+ed)\b", r"don't \1", result, flags=re.IGNORECASE)
-    # -en endings (participles): forgotten, broken, taken, etc.
-    result = re.sub(r"\bdon\s+(\w+en)\b", r"don't \1", result, flags=re.IGNORECASE)
-    # -le/-ge/-se/-ze endings: struggle, trudge, lose, freeze, etc.
-    result = re.sub(r"\bdon\s+(\w+(?:le|ge|se|ze))\b", r"don't \1", result, flags=re.IGNORECASE)
-    
-    # Same for "won" → "won't"
-    result = re.sub(r"\bwon\s+(\w+ing|\w+ed|believe|think|know|want|need|like|go|do|be|have|make|say|tell|try|stop|wait|work|turn|move|run|walk|talk|speak|call|find|hold|sit|stand|open|close|break|change|use|show|help|bring|send|meet|learn|grow|fall|pick|let|get|take|give|come|put|look|see|hear|feel|stay|leave|keep|die|live|start|eat|drink|sleep|play|read|write|watch|listen)\b", r"won't \1", result, flags=re.IGNORECASE)
+    # Hardcoded common verbs first, then heuristics by word ending
+    # (-ing, -ed, -en, -le/-ge/-se/-ze); same for "won" → "won't"
+    result = _DON_VERB_PATTERNS.apply(result)
     
     # 15d. ORPHAN CONTRACTION FIX: "don" alone at end/before punctuation → "ain't"
     # Philosophy: If subword tokenization cuts "don't" to just "don", 
@@ -391,54 +653,18 @@ def cleanup_output(text: str, mode: str = "gentle", entropy_threshold: Optional[
     # - Before punctuation: \bdon(?=[.,!?])
     # - Before preposition/article (not a verb): \bdon\s+(of|the|a|an|to|for|with|from|about|by|on|in|at|my|your|his|her|their|its|this|that)
     # - Before common nouns (broken generation artifacts)
-    result = re.sub(r"\bdon\s*$", "ain't", result, flags=re.IGNORECASE)
-    result = re.sub(r"\bdon(?=[.,!?])", "ain't", result, flags=re.IGNORECASE)
-    result = re.sub(r"\bdon\s+(of|the|a|an|to|for|with|from|about|by|on|in|at|my|your|his|her|their|its|this|that)\b", r"ain't \1", result, flags=re.IGNORECASE)
-    
-    # AGGRESSIVE FIX: "don" + noun-like word (ends with s, es, tion, ness, ment, etc.) → "ain't"
-    # This catches broken generation like "don tangerines", "don tears", "don twilight"
-    result = re.sub(r"\bdon\s+(tangerine|tangerines|tear|tears|twilight|table|tables|street|streets|vendor|vendors|cigarette|cigarettes|apartment|apartments|bottle|bottles|glass|glasses|drink|drinks|key|keys|door|doors|room|rooms|window|windows|floor|floors|wall|walls|chair|chairs|bed|beds|toilet|paper|money|time|place|thing|things|people|person|man|men|woman|women|child|children|hand|hands|face|faces|eye|eyes|head|heart|life|death|love|hate|fear|pain|joy|hope|dream|dreams|night|day|morning|evening|rain|snow|sun|moon|star|stars|sky|earth|world|fire|water|air|light|dark|darkness|silence|noise|sound|voice|word|words|name|story|stories|truth|lie|lies|secret|secrets|memory|memories|moment|moments|year|years|month|week|hour|minute|second|train|trains|thought|thoughts|idea|ideas|feeling|feelings|sense|body|soul|mind|spirit|god|devil|angel|ghost|shadow|shadows|dust|dirt|mud|blood|bone|bones|skin|flesh|hair|breath|step|steps|road|roads|path|paths|way|ways|bridge|bridges|river|rivers|sea|ocean|wave|waves|wind|storm|cloud|clouds|thunder|lightning|fog|mist|haze|smoke|ash|ashes|flame|flames|spark|sparks|ice|stone|stones|rock|rocks|sand|grass|tree|trees|flower|flowers|leaf|leaves|root|roots|branch|branches|bird|birds|dog|dogs|cat|cats|horse|horses|fish|wolf|wolves|bear|snake|rat|rats|mouse|mice|bug|bugs|fly|flies|bee|bees|spider|spiders|worm|worms|twice|once|again|anymore|anyway|always|never|ever|often|sometimes|usually|rarely|seldom|here|there|now|then|today|tomorrow|yesterday|tonight|forever|together|alone|inside|outside|above|below|behind|ahead|around|away|back|down|up|over|under|through|across|along|beside|between|beyond|within|without|against|toward|towards|upon|onto|into|throughout|meanwhile|otherwise|somehow|somewhat|somewhere|anywhere|everywhere|nowhere|anywhere|nothing|something|everything|anything|anyone|someone|everyone|nobody|somebody|everybody)\b", r"ain't \1", result, flags=re.IGNORECASE)
-    
-    # Same for "won" orphan → "ain't" (rare but possible)
-    result = re.sub(r"\bwon\s*$", "ain't", result, flags=re.IGNORECASE)
-    result = re.sub(r"\bwon(?=[.,!?])", "ain't", result, flags=re.IGNORECASE)
-    
-    # "they" + "my" (missing 're) → "they’re my"
-    result = re.sub(r"\bthey\s+my\b", "they’re my", result, flags=re.IGNORECASE)
-    
-        # 15c. Additional subword-style broken contractions (space instead of apostrophe)
-    # "they re" → "they're", "you re" → "you're", etc.
-    result = re.sub(r"\bthey\s+re\b", "they're", result, flags=re.IGNORECASE)
-    result = re.sub(r"\byou\s+re\b", "you're", result, flags=re.IGNORECASE)
-    result = re.sub(r"\bwe\s+re\b", "we're", result, flags=re.IGNORECASE)
-    result = re.sub(r"\bthey\s+ve\b", "they've", result, flags=re.IGNORECASE)
-    result = re.sub(r"\byou\s+ve\b", "you've", result, flags=re.IGNORECASE)
-    result = re.sub(r"\bwe\s+ve\b", "we've", result, flags=re.IGNORECASE)
-    result = re.sub(r"\bi\s+ve\b", "I've", result, flags=re.IGNORECASE)
-    result = re.sub(r"\bthey\s+ll\b", "they'll", result, flags=re.IGNORECASE)
-    result = re.sub(r"\byou\s+ll\b", "you'll", result, flags=re.IGNORECASE)
-    result = re.sub(r"\bwe\s+ll\b", "we'll", result, flags=re.IGNORECASE)
-    result = re.sub(r"\bi\s+ll\b", "I'll", result, flags=re.IGNORECASE)
+    #
+    # Then 15c: additional subword-style broken contractions (space instead
+    # of apostrophe): "they re" → "they're", "you re" → "you're", etc.
+    result = _ORPHAN_CONTRACTION_PATTERNS.apply(result)
     
     # 15d. Fix grammar errors with contractions
     # "don't trying" → "don't try" (wrong verb form after negation)
     # "can't going" → "can't go", etc.
-    # Use character class to match both ASCII apostrophe (') and fancy apostrophe (')
-    apos = "['\u2019]"  # ASCII U+0027 and Right Single Quotation Mark U+2019
-    result = re.sub(rf"\b(don{apos}t|can{apos}t|won{apos}t|couldn{apos}t|wouldn{apos}t|shouldn{apos}t|isn{apos}t|aren{apos}t|wasn{apos}t|weren{apos}t|haven{apos}t|hasn{apos}t|hadn{apos}t)\s+(\w+)ing\b", 
-                    lambda m: m.group(1) + ' ' + m.group(2), result, flags=re.IGNORECASE)
-    
-    # "didn't went" → "didn't go" (wrong tense after past negation)  
-    # Common irregular verbs
-    irregular_past_fixes = {
-        'went': 'go', 'came': 'come', 'saw': 'see', 'took': 'take',
-        'gave': 'give', 'made': 'make', 'got': 'get', 'had': 'have',
-        'said': 'say', 'told': 'tell', 'found': 'find', 'knew': 'know',
-        'thought': 'think', 'felt': 'feel', 'left': 'leave', 'kept': 'keep',
-    }
-    for past, base in irregular_past_fixes.items():
-        result = re.sub(rf"\b(didn{apos}t|couldn{apos}t|wouldn{apos}t|shouldn{apos}t)\s+{past}\b", 
-                        rf"\1 {base}", result, flags=re.IGNORECASE)
+    result = _NEGATION_ING_RE.sub(_drop_ing, result)
+    
+    # "didn't went" → "didn't go" (wrong tense after past negation)
+    result = _IRREGULAR_PAST_PATTERNS.apply(result)
     
     # 16. Remove word/phrase repetition (character-level generation artifact)
     # BUT preserve intentional poetic repetitions
@@ -450,12 +676,8 @@ def cleanup_output(text: str, mode: str = "gentle", entropy_threshold: Optional[
     
     # Handle triple+ repetition (more aggressive)
     # "the the the" → "the" (almost certainly an error)
-    def remove_triple(match):
-        word = match.group(1)
-        # Even with preserve regions, 3+ repetitions without punctuation are errors
-        return word
-    
-    result = re.sub(r'\b(\w+)(?:\s+\1){2,}\b', remove_triple, result, flags=re.IGNORECASE)
+    # Even with preserve regions, 3+ repetitions without punctuation are errors
+    result = _TRIPLE_REPETITION_RE.sub(r'\1', result)
     
     # Handle two-word phrase repetitions
     # "the haze the haze" → "the haze"
@@ -471,7 +693,7 @@ def cleanup_output(text: str, mode: str = "gentle", entropy_threshold: Optional[
         return phrase
     
     # Two-word phrases repeated (e.g., "the haze the haze")
-    result = re.sub(r'\b(\w+\s+\w+)\s+\1\b', remove_phrase_repetition, result, flags=re.IGNORECASE)
+    result = _PHRASE_REPETITION_RE.sub(remove_phrase_repetition, result)
     
     # Then handle double repetition (more careful)
     # Only remove if NOT in a preserve region
@@ -490,7 +712,7 @@ def cleanup_output(text: str, mode: str = "gentle", entropy_threshold: Optional[
         return word
     
     # Handle remaining double repetitions
-    result = re.sub(r'\b(\w+)\s+\1\b', remove_if_not_preserved, result, flags=re.IGNORECASE)
+    result = _DOUBLE_REPETITION_RE.sub(remove_if_not_preserved, result)
     
     # 17. Fix common word fragments (character-level artifacts)
     # Always apply basic fragment cleanup in gentle mode too
@@ -498,39 +720,18 @@ def cleanup_output(text: str, mode: str = "gentle", entropy_threshold: Optional[
     # 17a. Remove orphan apostrophe fragments: 't, 's, 'm, 're, 've, 'll, 'd
     # These are leftovers from broken contractions
     # Match both ASCII ' and fancy ' apostrophes
-    result = re.sub(r"\s+['''][tsmd]\b", '', result)
-    result = re.sub(r"\s+['''](?:re|ve|ll)\b", '', result)
+    result = _ORPHAN_APOSTROPHE_PATTERNS.apply(result)
     
     # 17b. Remove words that start with apostrophe (broken fragments)
     # e.g., "'nt" at word start, "On't" → remove
     # BUT preserve valid contractions: I'm, I've, I'll, I'd, etc.
-    def remove_apostrophe_garbage(match):
-        word = match.group(0)
-        # Normalize apostrophe for comparison
-        word_normalized = word.replace("'", "'").replace(chr(8217), "'")
-        # Valid contractions (all with ASCII apostrophe for comparison)
-        valid_contractions = {"I'm", "I've", "I'll", "I'd", "it's", "he's", "she's", 
-                              "that's", "what's", "there's", "where's", "who's",
-                              "don't", "won't", "can't", "isn't", "aren't", "wasn't",
-                              "weren't", "hasn't", "haven't", "hadn't", "doesn't",
-                              "didn't", "wouldn't", "couldn't", "shouldn't", "ain't",
-                              "you're", "you've", "you'll", "you'd", "we're", "we've",
-                              "we'll", "they're", "they've", "they'll", "let's"}
-        if word_normalized in valid_contractions or word_normalized.lower() in {c.lower() for c in valid_contractions}:
-            return word
-        return ''
-    
     # Match STANDALONE apostrophe-words only (not contraction endings like 're in they're)
     # Use negative lookbehind to ensure NOT preceded by a letter
-    result = re.sub(r"(?<![a-zA-Z])['''][a-z]+\b", remove_apostrophe_garbage, result)
+    result = _APOSTROPHE_WORD_RE.sub(_remove_apostrophe_garbage, result)
     
     # 17c. Remove obvious 1-2 char garbage (except real words and contraction endings)
     # Real words: I, a, an, or, so, oh, no, ok, to, go, we, he, me, my, by, etc.
     # Contraction endings: 'm, 's, 't, 'd, 've, 're, 'll (these come after apostrophe)
-    valid_short_words = {'i', 'a', 'an', 'or', 'so', 'oh', 'no', 'ok', 'to', 'go', 'we', 'he', 
-                         'me', 'my', 'by', 'if', 'in', 'on', 'up', 'do', 'be', 'is', 'it', 
-                         'at', 'as', 'of', 'am', 'us', 'hi'}  # Added 'hi'
-    
     # NOTE: Short word removal is disabled in gentle/moderate modes as it was too aggressive
     # Only apply in strict mode for maximum cleanup
     # This functionality is preserved for potential future use but not active by default
@@ -540,24 +741,16 @@ def cleanup_output(text: str, mode: str = "gentle", entropy_threshold: Optional[
     # But be more conservative - only remove if they look like obvious artifacts
     # "st lk mn" (consonant clusters) vs "go to a" (valid words)
     # Check if all fragments are in valid_short_words set
-    def check_fragment_sequence(match):
-        fragments = match.group(0).split()
-        # If all fragments are valid words, keep them
-        if all(f.lower() in valid_short_words for f in fragments):
-            return match.group(0)
-        # Otherwise, looks like garbage
-        return ''
-    
     # Only remove if mode is moderate or strict
     if mode in ["moderate", "strict"]:
-        result = re.sub(r'(\s+[a-z]{1,3}){3,}(?=\s|$)', check_fragment_sequence, result)
+        result = _FRAGMENT_SEQUENCE_RE.sub(_check_fragment_sequence, result)
     
     # 17e. Clean up leftover multiple spaces
-    result = re.sub(r'\s{2,}', ' ', result)
+    result = _MULTI_SPACE_RE.sub(' ', result)
     
     # 17f. Clean up orphan punctuation left after removal
-    result = re.sub(r'\s+([,;:])\s*', r'\1 ', result)
-    result = re.sub(r'^\s*[,;:]\s*', '', result)  # Remove leading comma/etc
+    result = _ORPHAN_PUNCT_RE.sub(r'\1 ', result)
+    result = _LEADING_PUNCT_RE.sub('', result)  # Remove leading comma/etc
     
     if mode in ["moderate", "strict"]:
         # Additional cleanup for these modes
@@ -571,23 +764,11 @@ def cleanup_output(text: str, mode: str = "gentle", entropy_threshold: Optional[
     # Look for pattern: "clause I verb" or "clause you verb" or "clause we verb"
     # These are likely independent clauses that need separation
     
-    # Common run-on patterns with high-frequency words
-    run_on_patterns = [
-        # "I went there I saw things" → "I went there. I saw things"
-        (r'(\w+)\s+(I\s+(?:am|was|have|had|do|did|will|would|can|could|should|shall|may|might|must|saw|went|came|got|made|took|gave|said|thought|felt|knew|looked|turned|walked|ran|tried|wanted|needed|loved|hated|found|lost|kept|left|stayed|started|stopped))\b', r'\1. \2'),
-        # Similar for "you", "we", "they", "he", "she"
-        (r'(\w+)\s+(you\s+(?:are|were|have|had|do|did|will|would|can|could|should|shall|may|might|saw|went|came|got))\b', r'\1. \2'),
-        (r'(\w+)\s+(we\s+(?:are|were|have|had|do|did|will|would|can|could|should|shall|saw|went|came|got))\b', r'\1. \2'),
-        (r'(\w+)\s+(they\s+(?:are|were|have|had|do|did|will|would|saw|went|came|got))\b', r'\1. \2'),
-        (r'(\w+)\s+(he\s+(?:is|was|has|had|does|did|will|would|can|could|saw|went|came|got|said|thought))\b', r'\1. \2'),
-        (r'(\w+)\s+(she\s+(?:is|was|has|had|does|did|will|would|can|could|saw|went|came|got|said|thought))\b', r'\1. \2'),
-    ]
-    
     # Only apply run-on fixes in moderate/strict mode to preserve style in gentle mode
     if mode in ["moderate", "strict"]:
-        for pattern, replacement in run_on_patterns:
+        for pattern, replacement in _RUN_ON_PATTERNS:
             # Only apply if the result would be 2+ complete sentences
-            temp_result = re.sub(pattern, replacement, result, count=1, flags=re.IGNORECASE)
+            temp_result = pattern.sub(replacement, result, count=1)
             # Check if this creates better sentence structure
             if temp_result.count('.') > result.count('.'):
                 result = temp_result
@@ -627,7 +808,7 @@ def cleanup_output(text: str, mode: str = "gentle", entropy_threshold: Optional[
     # In strict mode: additional cleanup
     if mode == "strict":
         # Remove trailing fragments
-        result = re.sub(r'\s+\w{1,3}\s*$', '', result)
+        result = _TRAILING_FRAGMENT_RE.sub('', result)
         # Ensure ends with proper punctuation
         if result and result[-1] not in '.!?':
             result = result.rstrip() + '.'
@@ -657,6 +838,9 @@ def cleanup_with_resonance(text: str, resonance_score: Optional[float] = None, e
     
     Returns:
         Cleaned text with mode selected based on metrics
+    
+    The metrics only select (mode, preserve_resonance), so repeated
+    texts hit the cleanup_output cache regardless of exact scores.
     """
     # Default to gentle mode
     mode = "gentle"
@@ -681,6 +865,14 @@ def cleanup_with_resonance(text: str, resonance_score: Optional[float] = None, e
     return cleanup_output(text, mode=mode, preserve_resonance=preserve_resonance)
 
 
+_CAP_AFTER_PUNCT_RE = re.compile(r'([.!?])\s+([a-z])')
+
+
+def _cap_after_punct(m) -> str:
+    """Single space + uppercase after sentence punctuation."""
+    return m.group(1) + ' ' + m.group(2).upper()
+
+
 def ensure_sentence_boundaries(text: str) -> str:
     """
     Ensure proper sentence boundaries and capitalization.
@@ -712,10 +904,7 @@ def ensure_sentence_boundaries(text: str) -> str:
         result = result[0].upper() + result[1:]
     
     # Ensure capitalization after sentence endings
-    def cap_after_punct(m):
-        return m.group(1) + ' ' + m.group(2).upper()
-    
-    result = re.sub(r'([.!?])\s+([a-z])', cap_after_punct, result)
+    result = _CAP_AFTER_PUNCT_RE.sub(_cap_after_punct, result)
     
     return result
 
@@ -750,6 +939,17 @@ def cleanup_dialogue(text: str) -> str:
     return '\n'.join(cleaned_lines)
 
 
+_GARBAGE_PATTERNS = tuple(re.compile(p) for p in (
+    r'\.[,?\.]{2,}',      # .,,?
+    r'\?[.,]{2,}',        # ?..
+    r',[.,]{2,}',         # ,.,
+    r'\s+[,\.]\s+[,\.]',  # " , . "
+    r'\.{5,}',            # .....
+    r'\s{3,}',            # multiple spaces
+    r'\b[a-z]\s+[a-z]\s+[a-z]\b',  # single char fragments
+))
+
+
 def calculate_garbage_score(text: str) -> float:
     """
     Calculate how much "garbage" (noise) is in text.
@@ -759,21 +959,15 @@ def calculate_garbage_score(text: str) -> float:
     """
     if not text or not isinstance(text, str):
         return 0.0
-    
-    garbage_patterns = [
-        r'\.[,?\.]{2,}',      # .,,?
-        r'\?[.,]{2,}',        # ?..
-        r',[.,]{2,}',         # ,.,
-        r'\s+[,\.]\s+[,\.]',  # " , . "
-        r'\.{5,}',            # .....
-        r'\s{3,}',            # multiple spaces
-        r'\b[a-z]\s+[a-z]\s+[a-z]\b',  # single char fragments
-    ]
-    
+    return _garbage_score_cached(text)
+
+
+@functools.lru_cache(maxsize=8192)
+def _garbage_score_cached(text: str) -> float:
+    """Garbage score for a non-empty string (pure, memoized)."""
     total_garbage = 0
-    for pattern in garbage_patterns:
-        matches = re.findall(pattern, text)
-        total_garbage += len(matches)
+    for pattern in _GARBAGE_PATTERNS:
+        total_garbage += len(pattern.findall(text))
     
     # Normalize by text length
     text_len = max(len(text), 1)
@@ -16,7 +16,7 @@
 
 from __future__ import annotations
 import numpy as np
-from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
+from typing import DefaultDict, Dict, List, Optional, Tuple, TYPE_CHECKING
 from collections import defaultdict, Counter
 from dataclasses import dataclass, field
 
@@ -39,8 +39,12 @@ class CooccurField:
     """
     
     vocab_size: int
-    bigram_counts: Dict[int, Counter] = field(default_factory=dict)
-    trigram_counts: Dict[Tuple[int, int], Counter] = field(default_factory=dict)
+    # defaultdicts so injectors (lexicon, overthinking) can increment
+    # unseen contexts directly; readers test membership before indexing
+    bigram_counts: DefaultDict[int, Counter] = field(
+        default_factory=lambda: defaultdict(Counter))
+    trigram_counts: DefaultDict[Tuple[int, int], Counter] = field(
+        default_factory=lambda: defaultdict(Counter))
     cooccur_counts: Dict[int, Counter] = field(default_factory=dict)
     token_counts: Counter = field(default_factory=Counter)
     total_tokens: int = 0
@@ -68,8 +72,8 @@ class CooccurField:
         tokens = vocab.encode(text)
         n = len(tokens)
         
-        bigram_counts: Dict[int, Counter] = defaultdict(Counter)
-        trigram_counts: Dict[Tuple[int, int], Counter] = defaultdict(Counter)
+        bigram_counts: DefaultDict[int, Counter] = defaultdict(Counter)
+        trigram_counts: DefaultDict[Tuple[int, int], Counter] = defaultdict(Counter)
         cooccur_counts: Dict[int, Counter] = defaultdict(Counter)
         token_counts: Counter = Counter()
         
@@ -99,8 +103,8 @@ class CooccurField:
         
         return cls(
             vocab_size=vocab.vocab_size,
-            bigram_counts=dict(bigram_counts),
-            trigram_counts=dict(trigram_counts),
+            bigram_counts=bigram_counts,
+            trigram_counts=trigram_counts,
             cooccur_counts=dict(cooccur_counts),
             token_counts=token_counts,
             total_tokens=n,
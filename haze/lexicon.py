@@ -20,10 +20,15 @@
 from __future__ import annotations
 import asyncio
 import re
+import sys
 import time
-from typing import List, Tuple, Optional, Dict, Set, TYPE_CHECKING
-from collections import Counter
+import numpy as np
+from itertools import islice
+from types import MappingProxyType
+from typing import Deque, List, Tuple, Optional, Dict, KeysView, Mapping, Set, TYPE_CHECKING
+from collections import Counter, OrderedDict, deque
 from dataclasses import dataclass, field
+from functools import cached_property
 
 if TYPE_CHECKING:
     from .haze import Vocab
@@ -36,6 +41,14 @@ except ImportError:
     HAS_AIOSQLITE = False
 
 
+# Word tokenizer shared by every extraction path.
+# Greedy \w+ always stops on a word boundary, so no \b anchors needed.
+_WORD_RE = re.compile(r"\w+")
+
+# Cap on memoized per-word boundary tokens (least recently used evicted)
+_ENC_CACHE_SIZE = 4096
+
+
 @dataclass
 class AbsorptionRecord:
     """Record of what was absorbed from an interaction."""
@@ -98,41 +111,101 @@ class Lexicon:
         self.decay_rate = decay_rate
         self.min_word_length = min_word_length
         
-        # Absorbed content
-        self.absorbed_words: Set[str] = set()
+        # Word weights live in a flat array indexed by slot; _word_ids maps
+        # word -> slot (insertion ordered). Free slots hold NaN so vector
+        # comparisons skip them, and are reused before the array grows.
+        self._weights = np.full(64, np.nan)
+        self._word_ids: Dict[str, int] = {}
+        self._slot_words: List[Optional[str]] = []
+        self._free: List[int] = []
+        # Slots written while an async decay sweeps a snapshot (else None)
+        self._dirty: Optional[Set[int]] = None
         self.absorbed_trigrams: Set[Tuple[str, str, str]] = set()
         
-        # Word weights (for decay)
-        self.word_weights: Dict[str, float] = {}
-        
-        # History
-        self.history: List[AbsorptionRecord] = []
-        
-        # Corpus words (to detect novelty)
-        self._build_corpus_vocabulary()
-    
-    def _build_corpus_vocabulary(self) -> None:
-        """Extract vocabulary from corpus via the field."""
-        # Get all words that have bigram entries
-        self.corpus_words: Set[str] = set()
+        # Per-word (first, last) boundary tokens reused across trigrams
+        # and turns; () for words that encode to nothing. LRU-bounded.
+        self._enc_cache: OrderedDict[str, Tuple[int, ...]] = OrderedDict()
         
-        # Decode all tokens to get corpus vocabulary
-        for token_id in range(self.vocab.vocab_size):
-            char = self.vocab.decode([token_id])
-            self.corpus_words.add(char.lower())
+        # History (bounded; appends evict the oldest record)
+        self.history: Deque[AbsorptionRecord] = deque(maxlen=100)
     
-    def _extract_words(self, text: str) -> List[str]:
-        """Extract words from text."""
-        words = re.findall(r'\b\w+\b', text.lower())
-        return [w for w in words if len(w) >= self.min_word_length]
+    @property
+    def absorbed_words(self) -> KeysView[str]:
+        """Live view of absorbed words."""
+        return self._word_ids.keys()
     
-    def _extract_trigrams(self, text: str) -> List[Tuple[str, str, str]]:
-        """Extract trigrams from text."""
-        words = re.findall(r'\b\w+\b', text.lower())
-        trigrams = []
-        for i in range(len(words) - 2):
-            trigrams.append((words[i], words[i+1], words[i+2]))
-        return trigrams
+    @property
+    def word_weights(self) -> Mapping[str, float]:
+        """
+        Read-only snapshot of word -> weight.
+        
+        Item assignment raises TypeError; use set_weight() / remove().
+        """
+        idx = np.fromiter(self._word_ids.values(), dtype=np.intp,
+                          count=len(self._word_ids))
+        return MappingProxyType(dict(zip(self._word_ids, self._weights[idx].tolist())))
+    
+    def get_weight(self, word: str, default: float = 1.0) -> float:
+        """Current weight of an absorbed word."""
+        slot = self._word_ids.get(word)
+        return default if slot is None else float(self._weights[slot])
+    
+    def set_weight(self, word: str, weight: float) -> None:
+        """Set a word's weight, absorbing the word if it is new."""
+        slot = self._word_ids.get(word)
+        if slot is None:
+            slot = self._alloc_slot(sys.intern(word))
+        self._weights[slot] = weight
+        if self._dirty is not None:
+            self._dirty.add(slot)
+    
+    def remove(self, word: str) -> bool:
+        """Forget an absorbed word. Returns False if it was not absorbed."""
+        slot = self._word_ids.get(word)
+        if slot is None:
+            return False
+        self._free_slot(slot)
+        return True
+    
+    def _alloc_slot(self, word: str) -> int:
+        """Assign a weight slot to a new word, reusing freed slots first."""
+        if self._free:
+            slot = self._free.pop()
+            self._slot_words[slot] = word
+        else:
+            slot = len(self._slot_words)
+            if slot == len(self._weights):
+                grown = np.full(2 * slot, np.nan)
+                grown[:slot] = self._weights
+                self._weights = grown
+            self._slot_words.append(word)
+        self._word_ids[word] = slot
+        return slot
+    
+    def _free_slot(self, slot: int) -> None:
+        """Release a word's slot for reuse."""
+        word = self._slot_words[slot]
+        self._slot_words[slot] = None
+        del self._word_ids[word]
+        self._enc_cache.pop(word, None)
+        self._weights[slot] = np.nan
+        self._free.append(slot)
+        if self._dirty is not None:
+            self._dirty.add(slot)
+    
+    @cached_property
+    def corpus_words(self) -> Set[str]:
+        """Corpus vocabulary (built on first access; unused by absorption)."""
+        itos = self.vocab.itos
+        return {
+            itos.get(token_id, "?").lower()
+            for token_id in range(self.vocab.vocab_size)
+        }
+    
+    def _tokenize(self, text: str) -> List[str]:
+        """Split text into lowercased, interned word tokens."""
+        # Interned keys let dict/set probes match by identity
+        return list(map(sys.intern, _WORD_RE.findall(text.lower())))
     
     def absorb(
         self,
@@ -153,30 +226,45 @@ class Lexicon:
         Returns:
             Record of what was absorbed
         """
-        # Extract patterns
-        words = self._extract_words(text)
-        trigrams = self._extract_trigrams(text)
+        # Extract patterns in one tokenizer pass: words are length-filtered,
+        # trigrams span all tokens (short words still link phrases)
+        tokens = self._tokenize(text)
+        counts = Counter(w for w in tokens if len(w) >= self.min_word_length)
+        trigrams = list(zip(tokens, tokens[1:], tokens[2:]))
         
         new_words = []
-        new_trigrams = []
         
-        # Absorb new words
-        for word in words:
-            if word not in self.absorbed_words:
-                self.absorbed_words.add(word)
-                self.word_weights[word] = boost
+        # Absorb new words (one probe per distinct word)
+        slots = np.empty(len(counts), dtype=np.intp)
+        reps = np.empty(len(counts))
+        for k, (word, n) in enumerate(counts.items()):
+            slot = self._word_ids.get(word)
+            if slot is None:
+                slot = self._alloc_slot(word)
+                self._weights[slot] = boost
                 new_words.append(word)
-            else:
-                # Reinforce existing word
-                self.word_weights[word] = min(2.0, self.word_weights.get(word, 1.0) + 0.1)
-        
-        # Absorb new trigrams
-        for tri in trigrams:
-            if tri not in self.absorbed_trigrams:
-                self.absorbed_trigrams.add(tri)
-                new_trigrams.append(tri)
-                # Inject into field
-                self._inject_trigram(tri, boost)
+                # Repeats within this turn reinforce the fresh word
+                n -= 1
+            slots[k] = slot
+            reps[k] = n
+        
+        # Reinforce by 0.1 per occurrence, capped at 2.0
+        if len(slots):
+            w = self._weights[slots]
+            self._weights[slots] = np.where(
+                reps > 0, np.minimum(w + 0.1 * reps, 2.0), w)
+            if self._dirty is not None:
+                self._dirty.update(slots.tolist())
+        
+        # Absorb new trigrams (deduplicated, in first-seen order)
+        absorbed = self.absorbed_trigrams
+        new_trigrams = [tri for tri in dict.fromkeys(trigrams) if tri not in absorbed]
+        absorbed.update(new_trigrams)
+        
+        # Inject into field
+        inject = self._inject_trigram
+        for tri in new_trigrams:
+            inject(tri, boost)
         
         # Create record
         record = AbsorptionRecord(
@@ -188,11 +276,23 @@ class Lexicon:
         
         # Store in history
         self.history.append(record)
-        if len(self.history) > 100:
-            self.history = self.history[-100:]
         
         return record
     
+    def _boundary_tokens(self, word: str) -> Tuple[int, ...]:
+        """(first, last) token of a word, memoized per word."""
+        cache = self._enc_cache
+        bounds = cache.get(word)
+        if bounds is None:
+            tokens = self.vocab.encode(word)
+            bounds = (tokens[0], tokens[-1]) if tokens else ()
+            cache[word] = bounds
+            if len(cache) > _ENC_CACHE_SIZE:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(word)
+        return bounds
+    
     def _inject_trigram(
         self,
         trigram: Tuple[str, str, str],
@@ -204,34 +304,30 @@ class Lexicon:
         This modifies the field's statistics so future generation
         can use patterns from user input!
         """
-        # Encode each word to tokens
-        w1_tokens = self.vocab.encode(trigram[0])
-        w2_tokens = self.vocab.encode(trigram[1])
-        w3_tokens = self.vocab.encode(trigram[2])
-        
-        if not w1_tokens or not w2_tokens or not w3_tokens:
+        # Counts are integral: fractional weights below 1 add nothing
+        iw = int(weight)
+        if iw == 0:
             return
         
-        # Get boundary tokens
-        last_w1 = w1_tokens[-1]
-        first_w2 = w2_tokens[0]
-        last_w2 = w2_tokens[-1]
-        first_w3 = w3_tokens[0]
+        # Get boundary tokens of each word
+        w1 = self._boundary_tokens(trigram[0])
+        w2 = self._boundary_tokens(trigram[1])
+        w3 = self._boundary_tokens(trigram[2])
         
-        # Inject into bigram counts
-        if last_w1 not in self.field.bigram_counts:
-            self.field.bigram_counts[last_w1] = Counter()
-        self.field.bigram_counts[last_w1][first_w2] += int(weight)
+        if not w1 or not w2 or not w3:
+            return
+        
+        last_w1 = w1[1]
+        first_w2, last_w2 = w2
+        first_w3 = w3[0]
         
-        if last_w2 not in self.field.bigram_counts:
-            self.field.bigram_counts[last_w2] = Counter()
-        self.field.bigram_counts[last_w2][first_w3] += int(weight)
+        # Inject into bigram counts (defaultdict creates missing contexts)
+        bigram_counts = self.field.bigram_counts
+        bigram_counts[last_w1][first_w2] += iw
+        bigram_counts[last_w2][first_w3] += iw
         
         # Update trigram counts
-        key = (last_w1, first_w2)
-        if key not in self.field.trigram_counts:
-            self.field.trigram_counts[key] = Counter()
-        self.field.trigram_counts[key][last_w2] += int(weight)
+        self.field.trigram_counts[(last_w1, first_w2)][last_w2] += iw
     
     def decay(self) -> int:
         """
@@ -243,24 +339,50 @@ class Lexicon:
         Returns:
             Number of patterns that decayed below threshold
         """
-        decayed = 0
-        
-        # Decay word weights
-        words_to_remove = []
-        for word, weight in self.word_weights.items():
-            new_weight = weight * self.decay_rate
-            if new_weight < 0.1:
-                words_to_remove.append(word)
-                decayed += 1
-            else:
-                self.word_weights[word] = new_weight
+        return self._apply_decay(*self._decayed_weights(self._weights[:len(self._slot_words)]))
+    
+    def _decayed_weights(self, weights: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Decayed copy of weights and the slots now below threshold.
         
-        # Remove decayed words
-        for word in words_to_remove:
-            self.absorbed_words.discard(word)
-            del self.word_weights[word]
+        Touches no lexicon state, so it may run off the event loop.
+        """
+        # NaN free slots stay NaN and never compare below threshold
+        live = weights * self.decay_rate
+        return live, np.flatnonzero(live < 0.1)
+    
+    def _begin_decay(self) -> np.ndarray:
+        """Snapshot the slot weights and start tracking later writes."""
+        self._dirty = set()
+        return self._weights[:len(self._slot_words)].copy()
+    
+    def _finish_decay(self, snap: np.ndarray, live: np.ndarray, dead: np.ndarray) -> int:
+        """
+        Install a decay computed from snap, keeping writes made since.
         
-        return decayed
+        A slot written after the snapshot gets its decayed snapshot value
+        plus whatever the writes added (new words are not decayed).
+        """
+        dirty, self._dirty = self._dirty, None
+        if dirty:
+            touched = np.fromiter(dirty, dtype=np.intp, count=len(dirty))
+            touched = touched[touched < len(snap)]
+            old = snap[touched]
+            cur = self._weights[touched]
+            new = np.where(np.isnan(old), cur, live[touched] + (cur - old))
+            live[touched] = new
+            dead = np.union1d(np.setdiff1d(dead, touched), touched[new < 0.1])
+        return self._apply_decay(live, dead)
+    
+    def _apply_decay(self, live: np.ndarray, dead: np.ndarray) -> int:
+        """Install decayed weights and free the dead slots."""
+        self._weights[:len(live)] = live
+        
+        # Free the slots of decayed words
+        for slot in dead.tolist():
+            self._free_slot(slot)
+        
+        return len(dead)
     
     def get_resonant_words(self, n: int = 20) -> List[str]:
         """
@@ -268,12 +390,13 @@ class Lexicon:
         
         These are words that have been reinforced through conversation.
         """
-        sorted_words = sorted(
-            self.word_weights.items(),
-            key=lambda x: x[1],
-            reverse=True
-        )
-        return [w for w, _ in sorted_words[:n]]
+        words = list(self._word_ids)
+        if n <= 0 or not words:
+            return []
+        idx = np.fromiter(self._word_ids.values(), dtype=np.intp, count=len(words))
+        # Stable sort keeps insertion order among equal weights
+        order = np.argsort(-self._weights[idx], kind="stable")[:n]
+        return [words[i] for i in order.tolist()]
     
     def stats(self) -> LexiconStats:
         """Get lexicon statistics."""
@@ -282,14 +405,14 @@ class Lexicon:
         
         # Calculate growth rate
         if len(self.history) >= 2:
-            recent = self.history[-10:]
+            recent = list(islice(reversed(self.history), 10))
             total_absorbed = sum(r.count for r in recent)
             growth_rate = total_absorbed / len(recent)
         else:
             growth_rate = 0.0
         
         return LexiconStats(
-            total_words=len(self.absorbed_words),
+            total_words=len(self._word_ids),
             total_trigrams=len(self.absorbed_trigrams),
             unique_sources=len(sources),
             recent_absorptions=len(self.history),
@@ -299,9 +422,11 @@ class Lexicon:
 
 class AsyncLexicon:
     """
-    Async version of Lexicon with field lock discipline.
+    Async version of Lexicon with a single-writer discipline.
     
-    Based on Leo's async pattern - explicit atomicity for field coherence.
+    All mutations (absorb, decay) are queued to one writer task, which
+    applies whatever has queued up as a batch. The sync lexicon never
+    awaits mid-update, so readers see a coherent field without a lock.
     """
     
     def __init__(
@@ -323,9 +448,14 @@ class AsyncLexicon:
             db_path: Optional path to SQLite DB for persistence
         """
         self._sync = Lexicon(vocab, cooccur_field, decay_rate, min_word_length)
-        self._field_lock = asyncio.Lock()
         self.db_path = db_path
         self._db_conn = None
+        
+        # Writer task is started lazily (needs a running loop).
+        self._queue: Optional[asyncio.Queue] = None
+        self._writer_task: Optional[asyncio.Task] = None
+        self._decay_task: Optional[asyncio.Task] = None
+        self._decay_lock: Optional[asyncio.Lock] = None  # one snapshot in flight
     
     async def __aenter__(self):
         """Async context manager entry."""
@@ -336,6 +466,16 @@ class AsyncLexicon:
     
     async def __aexit__(self, *args):
         """Async context manager exit."""
+        # Let a scheduled decay finish before the writer goes away
+        if self._decay_task:
+            await asyncio.wait([self._decay_task])
+            self._decay_task = None
+        # Sentinel lets the writer drain queued mutations, then stop
+        if self._writer_task:
+            if not self._writer_task.done():
+                await self._queue.put(None)
+            await asyncio.wait([self._writer_task])
+            self._writer_task = None
         if self._db_conn:
             await self._db_conn.close()
     
@@ -344,6 +484,11 @@ class AsyncLexicon:
         if not self._db_conn:
             return
         
+        # WAL + NORMAL sync: commits append to the log without a full fsync
+        await self._db_conn.execute("PRAGMA journal_mode=WAL")
+        await self._db_conn.execute("PRAGMA synchronous=NORMAL")
+        await self._db_conn.execute("PRAGMA temp_store=MEMORY")
+        
         cursor = await self._db_conn.cursor()
         
         # Absorbed words table
@@ -377,54 +522,125 @@ class AsyncLexicon:
         boost: float = 1.0,
     ) -> AbsorptionRecord:
         """
-        Absorb patterns atomically.
+        Absorb patterns via the writer task.
+        
+        Returns once the record is applied (and persisted, with a DB).
+        """
+        return await self._submit(self._sync.absorb, text, source, boost)
+    
+    async def _submit(self, op, *args):
+        """Queue a mutation for the writer task and wait for its result."""
+        if self._writer_task is None or self._writer_task.done():
+            self._queue = asyncio.Queue()
+            self._writer_task = asyncio.create_task(self._writer())
         
-        Field evolution under lock ensures coherence.
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((op, args, future))
+        return await future
+    
+    async def _writer(self) -> None:
         """
-        async with self._field_lock:
-            record = self._sync.absorb(text, source, boost)
+        Apply queued mutations in arrival order, then persist the batch.
+        
+        Futures that were cancelled meanwhile are skipped. A None
+        sentinel stops the writer once the batch it arrived in is applied.
+        """
+        queue = self._queue
+        stop = False
+        
+        while not stop:
+            batch = [await queue.get()]
+            while not queue.empty():
+                batch.append(queue.get_nowait())
+            if None in batch:
+                stop = True
+                batch = [item for item in batch if item is not None]
+            
+            done = []
+            for op, args, fut in batch:
+                if fut.done():
+                    continue
+                try:
+                    result = op(*args)
+                except Exception as e:
+                    fut.set_exception(e)
+                    continue
+                done.append((fut, result))
             
-            # Persist to DB if available
-            if self._db_conn and record.count > 0:
-                await self._persist_record(record)
+            try:
+                # Persist to DB if available (one commit per batch)
+                if self._db_conn:
+                    records = [
+                        result for _, result in done
+                        if isinstance(result, AbsorptionRecord) and result.count > 0
+                    ]
+                    for record in records:
+                        await self._persist_record(record)
+                    if records:
+                        await self._db_conn.commit()
+            except Exception as e:
+                for fut, _ in done:
+                    if not fut.done():
+                        fut.set_exception(e)
+                continue
             
-            return record
+            for fut, result in done:
+                if not fut.done():
+                    fut.set_result(result)
     
     async def _persist_record(self, record: AbsorptionRecord):
-        """Persist absorption record to database."""
+        """Write absorption record rows (the caller commits)."""
         cursor = await self._db_conn.cursor()
         
         # Save words
-        for word in record.words:
-            weight = self._sync.word_weights.get(word, 1.0)
-            await cursor.execute('''
-                INSERT OR REPLACE INTO absorbed_words (word, weight, source, timestamp)
-                VALUES (?, ?, ?, ?)
-            ''', (word, weight, record.source, record.timestamp))
+        get_weight = self._sync.get_weight
+        await cursor.executemany('''
+            INSERT OR REPLACE INTO absorbed_words (word, weight, source, timestamp)
+            VALUES (?, ?, ?, ?)
+        ''', [(word, get_weight(word), record.source, record.timestamp)
+              for word in record.words])
         
         # Save trigrams
-        for tri in record.trigrams:
-            await cursor.execute('''
-                INSERT OR REPLACE INTO absorbed_trigrams (word1, word2, word3, source, timestamp)
-                VALUES (?, ?, ?, ?, ?)
-            ''', (tri[0], tri[1], tri[2], record.source, record.timestamp))
-        
-        await self._db_conn.commit()
+        await cursor.executemany('''
+            INSERT OR REPLACE INTO absorbed_trigrams (word1, word2, word3, source, timestamp)
+            VALUES (?, ?, ?, ?, ?)
+        ''', [(*tri, record.source, record.timestamp) for tri in record.trigrams])
     
     async def decay(self) -> int:
-        """Apply memory decay atomically."""
-        async with self._field_lock:
-            return self._sync.decay()
+        """
+        Apply memory decay.
+        
+        The O(N) weight sweep runs in the default executor over a snapshot,
+        outside the writer, so absorbs keep flowing meanwhile. Only
+        installing the result goes through the writer queue; slots absorbed
+        since the snapshot keep their updates. Readers keep seeing the
+        pre-decay weights until then.
+        """
+        if self._decay_lock is None:
+            self._decay_lock = asyncio.Lock()
+        async with self._decay_lock:
+            sync = self._sync
+            snap = sync._begin_decay()
+            try:
+                loop = asyncio.get_running_loop()
+                live, dead = await loop.run_in_executor(None, sync._decayed_weights, snap)
+            except BaseException:
+                sync._dirty = None
+                raise
+            return await self._submit(sync._finish_decay, snap, live, dead)
+    
+    def schedule_decay(self) -> asyncio.Task:
+        """Start a decay in the background and return its task."""
+        self._decay_task = asyncio.create_task(self.decay())
+        return self._decay_task
     
     async def get_resonant_words(self, n: int = 20) -> List[str]:
-        """Get resonant words atomically."""
-        async with self._field_lock:
-            return self._sync.get_resonant_words(n)
+        """Get resonant words (lock-free; never interleaves a write)."""
+        return self._sync.get_resonant_words(n)
     
     async def stats(self) -> LexiconStats:
-        """Get stats atomically."""
-        async with self._field_lock:
-            return self._sync.stats()
+        """Get stats (lock-free; never interleaves a write)."""
+        return self._sync.stats()
 
 
 def demo_lexicon():
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Tests for the AMK kernel (amk.py) and its SoA batch.
+"""
+
+import unittest
+from haze.amk import AMK, AMKStateBatch
+
+
+class TestAMKTemperature(unittest.TestCase):
+    """Test effective temperature bookkeeping."""
+    
+    def test_temperature_tracks_mutations(self):
+        """Temperature follows DSL, velocity, direct writes and reset."""
+        amk = AMK()
+        base = amk.get_temperature()
+        amk.exec("PAIN 0.9")
+        self.assertAlmostEqual(amk.get_temperature(), base - 0.27)
+        amk.set_velocity(2)
+        self.assertAlmostEqual(amk.get_temperature(), 1.2 - 0.27 + 0.04)
+        amk.state.pain = 1.0
+        self.assertAlmostEqual(amk.get_temperature(), 1.2 - 0.3 + 0.04)
+        amk.reset()
+        self.assertAlmostEqual(amk.get_temperature(), base)
+
+
+class TestAMKStateBatch(unittest.TestCase):
+    """Test that the batched kernel tracks the scalar AMK."""
+    
+    def assertClose(self, actual, expected, rel=1e-4, abs_tol=0.0):
+        self.assertLessEqual(abs(actual - expected), max(rel * abs(expected), abs_tol))
+    
+    def test_batch_matches_scalar_kernel(self):
+        """Batched step/debt/pain track the scalar AMK."""
+        kernels = [AMK() for _ in range(4)]
+        for mode, amk in zip([-1, 0, 1, 2], kernels):
+            amk.set_velocity(mode)
+            amk.state.tension = 0.4
+            amk.state.dissonance = 0.3
+        batch = AMKStateBatch.from_states([k.state for k in kernels])
+        
+        for _ in range(20):
+            for amk in kernels:
+                amk.update_debt(0.8, 0.3)
+                amk.step()
+                amk.compute_pain()
+            batch.update_debt(0.8, 0.3)
+            batch.step()
+            batch.compute_pain()
+        
+        temps = batch.get_temperature()
+        for i, (amk, state) in enumerate(zip(kernels, batch.to_states())):
+            self.assertEqual(state.velocity_mode, amk.state.velocity_mode)
+            self.assertClose(state.debt, amk.state.debt)
+            self.assertClose(state.temporal_debt, amk.state.temporal_debt)
+            self.assertClose(state.pain, amk.state.pain)
+            self.assertClose(temps[i], amk.get_temperature())
+        self.assertEqual(batch.time_direction[0], -1.0)
+    
+    def test_batch_update_from_cloud(self):
+        """Batched CLOUD coupling matches the scalar mapping."""
+        activations = [
+            {"FEAR": 0.6, "LOVE": 0.2, "RAGE": 0.4, "VOID": 0.3, "FLOW": 0.5, "COMPLEX": 0.2},
+            {"FEAR": 0.9, "LOVE": 0.8, "VOID": 0.9},
+            {},
+        ]
+        kernels = [AMK() for _ in activations]
+        for amk, acts in zip(kernels, activations):
+            amk.update_from_cloud(acts)
+        batch = AMKStateBatch(len(activations))
+        batch.update_from_cloud(activations)
+        
+        for amk, state in zip(kernels, batch.to_states()):
+            self.assertClose(state.tension, amk.state.tension, rel=0, abs_tol=1e-6)
+            self.assertClose(state.dissonance, amk.state.dissonance, rel=0, abs_tol=1e-6)
+            self.assertClose(state.cosmic_coherence, amk.state.cosmic_coherence, rel=0, abs_tol=1e-6)
+            self.assertClose(state.pain, amk.state.pain, rel=0, abs_tol=1e-6)
+
+
+if __name__ == '__main__':
+    unittest.main()
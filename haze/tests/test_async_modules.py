@@ -1,5 +1,5 @@
 """
-Tests for async haze modules: mathbrain, experts, trauma, subjectivity, cleanup.
+Tests for async haze modules: mathbrain, experts, trauma, subjectivity, cleanup, bridge, async lexicon.
 """
 
 import pytest
@@ -429,3 +429,301 @@ class TestSubjectivity:
         for center in subj.identity.gravity_centers:
             assert center not in MUNDANE_TRIGRAMS, \
                 f"Mundane trigram found in gravity centers: {center}"
+
+
+# ============================================================
+#  BRIDGE TESTS
+# ============================================================
+
+class _FakeCloud:
+    """Minimal CLOUD stand-in that counts pings."""
+    
+    def __init__(self):
+        self.pings = 0
+    
+    async def ping(self, user_input):
+        self.pings += 1
+        return {"input": user_input}
+    
+    async def close(self):
+        pass
+
+
+class TestBridgeCache:
+    """Tests for the HAZE ↔ CLOUD bridge semantic cache."""
+    
+    def test_near_duplicate_hits_cache(self):
+        """With a threshold set, near-duplicate inputs reuse the cached response."""
+        from bridge import AsyncBridge
+        
+        async def run_test():
+            cloud = _FakeCloud()
+            bridge = AsyncBridge(cloud=cloud, cache_size=128, cache_threshold=0.85)
+            first = await bridge.respond("I'm feeling anxious and scared")
+            second = await bridge.respond("i'm feeling  anxious and scared!")
+            assert cloud.pings == 1
+            assert second.cloud_hint is first.cloud_hint
+            assert bridge.cache_stats()["hits"] == 1
+            await bridge.__aexit__(None, None, None)
+        
+        asyncio.run(run_test())
+    
+    def test_cache_is_opt_in(self):
+        """Without cache_size every input reaches CLOUD (and its user history)."""
+        from bridge import AsyncBridge
+        
+        async def run_test():
+            cloud = _FakeCloud()
+            bridge = AsyncBridge(cloud=cloud)
+            await bridge.respond("hello there")
+            await bridge.respond("hello there")
+            assert cloud.pings == 2
+            assert bridge.cache_stats()["hits"] == 0
+            assert await bridge.warm_cache(["hello there"]) == 0
+            await bridge.__aexit__(None, None, None)
+        
+        asyncio.run(run_test())
+    
+    def test_exact_cache_keeps_opposite_emotions_apart(self):
+        """Without a threshold only the same normalized input shares a response."""
+        from bridge import AsyncBridge
+        
+        async def run_test():
+            cloud = _FakeCloud()
+            bridge = AsyncBridge(cloud=cloud, cache_size=128)
+            happy = await bridge.respond("When I walk home at night I always feel so happy")
+            sad = await bridge.respond("When I walk home at night I always feel so sad")
+            assert cloud.pings == 2
+            assert happy.cloud_hint != sad.cloud_hint
+            again = await bridge.respond("when I walk home at night  I always feel so HAPPY")
+            assert cloud.pings == 2
+            assert again.cloud_hint is happy.cloud_hint
+            await bridge.__aexit__(None, None, None)
+        
+        asyncio.run(run_test())
+    
+    def test_lru_eviction(self):
+        """Oldest entry is evicted when the cache is full."""
+        from bridge import AsyncBridge
+        
+        async def run_test():
+            cloud = _FakeCloud()
+            bridge = AsyncBridge(cloud=cloud, cache_size=2)
+            for text in ["hello there", "quantum fractals", "warm darkness"]:
+                await bridge.respond(text)
+            assert bridge.cache_stats()["size"] == 2
+            await bridge.respond("hello there")
+            assert cloud.pings == 4
+            await bridge.__aexit__(None, None, None)
+        
+        asyncio.run(run_test())
+    
+    def test_concurrent_pings_batched(self):
+        """Concurrent inputs are dispatched as one CLOUD batch."""
+        from bridge import AsyncBridge
+        
+        class BatchCloud(_FakeCloud):
+            batches = []
+            
+            async def ping_batch(self, texts):
+                self.batches.append(list(texts))
+                return [{"input": t} for t in texts]
+        
+        async def run_test():
+            cloud = BatchCloud()
+            bridge = AsyncBridge(cloud=cloud, cache_size=0)
+            texts = ["hello there", "quantum fractals", "warm darkness"]
+            responses = await asyncio.gather(*(bridge.respond(t) for t in texts))
+            assert cloud.batches == [texts]
+            assert [r.cloud_hint["input"] for r in responses] == texts
+            await bridge.__aexit__(None, None, None)
+        
+        asyncio.run(run_test())
+    
+    def test_short_batch_fails_missing_inputs(self):
+        """Inputs CLOUD returned no result for fall back instead of hanging."""
+        from bridge import AsyncBridge
+        
+        class ShortCloud(_FakeCloud):
+            async def ping_batch(self, texts):
+                return [{"input": texts[0]}]
+        
+        async def run_test():
+            bridge = AsyncBridge(cloud=ShortCloud(), cache_size=0, cloud_timeout=5.0)
+            texts = ["hello there", "quantum fractals"]
+            responses = await asyncio.gather(*(bridge.respond(t) for t in texts))
+            assert responses[0].cloud_hint == {"input": "hello there"}
+            assert responses[1].cloud_hint is None
+            assert bridge.stats()["cloud_failures"] == 1
+            await bridge.__aexit__(None, None, None)
+        
+        asyncio.run(run_test())
+    
+    def test_cancelled_batched_ping_is_not_a_result(self):
+        """A ping cancelled inside a batch propagates and is never cached."""
+        from bridge import AsyncBridge
+        
+        class CancellingCloud(_FakeCloud):
+            async def ping(self, user_input):
+                if user_input == "quantum fractals":
+                    raise asyncio.CancelledError()
+                return await super().ping(user_input)
+        
+        async def run_test():
+            cloud = CancellingCloud()
+            bridge = AsyncBridge(cloud=cloud, cache_size=8, cloud_timeout=5.0)
+            texts = ["hello there", "quantum fractals"]
+            results = await asyncio.gather(
+                *(bridge._ping_cloud_silent(t) for t in texts),
+                return_exceptions=True,
+            )
+            assert results[0] == {"input": "hello there"}
+            assert isinstance(results[1], asyncio.CancelledError)
+            assert bridge.cache_stats()["size"] == 1
+            await bridge.__aexit__(None, None, None)
+        
+        asyncio.run(run_test())
+    
+    def test_disk_cache_survives_restart(self, tmp_path):
+        """A new bridge answers from the persisted cache without pinging CLOUD."""
+        from bridge import AsyncBridge
+        
+        async def run_test():
+            path = tmp_path / "cloud_cache"
+            
+            bridge = AsyncBridge(cloud=_FakeCloud(), cache_path=path)
+            assert await bridge.warm_cache(["hello there", "warm darkness"]) == 2
+            await bridge.__aexit__(None, None, None)
+            
+            cloud = _FakeCloud()
+            bridge = AsyncBridge(cloud=cloud, cache_path=path)
+            response = await bridge.respond("Hello   THERE")
+            assert response.cloud_hint == {"input": "hello there"}
+            assert cloud.pings == 0
+            await bridge.__aexit__(None, None, None)
+        
+        asyncio.run(run_test())
+
+
+# ============================================================
+#  ASYNC LEXICON TESTS
+# ============================================================
+
+class TestAsyncLexicon:
+    """Tests for the single-writer AsyncLexicon."""
+    
+    def test_concurrent_absorbs_share_one_writer(self, tmp_path):
+        """Concurrent absorbs are all applied and persisted by the writer."""
+        pytest.importorskip("aiosqlite")
+        import sqlite3
+        from haze.haze import Vocab
+        from haze.cooccur import CooccurField
+        from haze.lexicon import AsyncLexicon
+        
+        corpus = "the quiet haze drifts over the field"
+        vocab = Vocab.from_text(corpus)
+        texts = ["quiet haze drifts", "warm fractal light", "haze over water"]
+        db_path = str(tmp_path / "lexicon.db")
+        
+        async def run_test():
+            async with AsyncLexicon(
+                vocab, CooccurField.from_text(corpus, vocab), db_path=db_path
+            ) as lex:
+                records = await asyncio.gather(*(lex.absorb(t) for t in texts))
+                assert [r.words for r in records] == [
+                    ["quiet", "haze", "drifts"],
+                    ["warm", "fractal", "light"],
+                    ["over", "water"],
+                ]
+                assert (await lex.stats()).total_words == 8
+                assert await lex.decay() == 0
+        
+        asyncio.run(run_test())
+        
+        with sqlite3.connect(db_path) as conn:
+            assert conn.execute("SELECT COUNT(*) FROM absorbed_words").fetchone() == (8,)
+            assert conn.execute("SELECT COUNT(*) FROM absorbed_trigrams").fetchone() == (3,)
+            assert conn.execute("PRAGMA journal_mode").fetchone() == ("wal",)
+    
+    def test_exit_drains_queued_absorbs(self, tmp_path):
+        """Leaving the context applies queued absorbs instead of stranding them."""
+        pytest.importorskip("aiosqlite")
+        import sqlite3
+        from haze.haze import Vocab
+        from haze.cooccur import CooccurField
+        from haze.lexicon import AsyncLexicon
+        
+        corpus = "the quiet haze drifts over the field"
+        vocab = Vocab.from_text(corpus)
+        texts = ["quiet haze drifts", "warm fractal light"]
+        db_path = str(tmp_path / "lexicon.db")
+        
+        async def run_test():
+            async with AsyncLexicon(
+                vocab, CooccurField.from_text(corpus, vocab), db_path=db_path
+            ) as lex:
+                pending = [asyncio.create_task(lex.absorb(t)) for t in texts]
+                await asyncio.sleep(0)  # queued, not yet applied
+        
+            records = await asyncio.wait_for(asyncio.gather(*pending), timeout=5)
+            assert [len(r.words) for r in records] == [3, 3]
+        
+        asyncio.run(run_test())
+        
+        with sqlite3.connect(db_path) as conn:
+            assert conn.execute("SELECT COUNT(*) FROM absorbed_words").fetchone() == (6,)
+    
+    def test_absorbs_proceed_during_decay_sweep(self):
+        """Absorbs are not queued behind a running decay sweep, nor lost by it."""
+        import threading
+        from haze.haze import Vocab
+        from haze.cooccur import CooccurField
+        from haze.lexicon import AsyncLexicon
+        
+        corpus = "the quiet haze drifts over the field"
+        vocab = Vocab.from_text(corpus)
+        
+        async def run_test():
+            lex = AsyncLexicon(vocab, CooccurField.from_text(corpus, vocab), decay_rate=0.5)
+            await lex.absorb("haze drifts")
+            
+            release = threading.Event()
+            sweep = lex._sync._decayed_weights
+            
+            def slow_sweep(weights):
+                release.wait(5)
+                return sweep(weights)
+            
+            lex._sync._decayed_weights = slow_sweep
+            task = lex.schedule_decay()
+            await asyncio.sleep(0)  # snapshot taken, sweep blocked
+            await asyncio.wait_for(lex.absorb("haze haze quiet"), timeout=1)
+            release.set()
+            
+            assert await task == 0
+            assert lex._sync.word_weights == pytest.approx(
+                {"haze": 0.7, "drifts": 0.5, "quiet": 1.0})
+            await lex.__aexit__(None, None, None)
+        
+        asyncio.run(run_test())
+    
+    def test_scheduled_decay_runs_behind_absorbs(self):
+        """Background decay frees slots without undoing later absorbs."""
+        from haze.haze import Vocab
+        from haze.cooccur import CooccurField
+        from haze.lexicon import AsyncLexicon
+        
+        corpus = "the quiet haze drifts over the field"
+        vocab = Vocab.from_text(corpus)
+        
+        async def run_test():
+            lex = AsyncLexicon(vocab, CooccurField.from_text(corpus, vocab), decay_rate=0.5)
+            await lex.absorb("quiet haze", boost=0.15)
+            task = lex.schedule_decay()
+            record = await lex.absorb("warm field", boost=1.0)
+            assert await task == 2
+            assert record.words == ["warm", "field"]
+            assert await lex.get_resonant_words() == ["warm", "field"]
+            await lex.__aexit__(None, None, None)
+        
+        asyncio.run(run_test())
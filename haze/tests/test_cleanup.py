@@ -4,6 +4,7 @@ Tests for enhanced cleanup.py functionality.
 """
 
 import unittest
+import re
 from haze.cleanup import (
     cleanup_output,
     cleanup_with_resonance,
@@ -316,5 +317,49 @@ class TestRealWorldExamples(unittest.TestCase):
         self.assertEqual(result.lower().count("the darkness"), 3)
 
 
+class TestPatternFamilies(unittest.TestCase):
+    """Test precompiled pattern families."""
+    
+    def test_prefilter_matches_plain_cascade(self):
+        """Prefiltered families give the same result as the plain cascade."""
+        from haze.cleanup import _PatternFamily, _apply_table
+        import haze.cleanup as cleanup
+        
+        families = [v for v in vars(cleanup).values() if isinstance(v, _PatternFamily)]
+        samples = [
+            "I dont know, its going well",
+            "they re here and we ll see",
+            "Haze remembersthe night..",
+            "didn’t went there. I don",
+            "nothing to see here",
+            # Python re treats \x1c-\x1f as whitespace
+            "it\x1cs fine",
+            "they\x1fre here",
+            # Unicode case folding (dotless i, dotted I, long s, Kelvin sign)
+            "—ım\nı",
+            "İ dont know",
+            "ſo its here",
+            "\u212aeep it",
+        ]
+        for family in families:
+            for text in samples:
+                self.assertEqual(family.apply(text), _apply_table(text, family.table))
+    
+    def test_prefilter_bypassed_for_unsafe_text(self):
+        """A negative scan is only trusted for ASCII text without \\x1c-\\x1f."""
+        from haze.cleanup import _PatternFamily
+        
+        class NeverMatches:
+            def scan(self, data, match_event_handler=None):
+                pass
+        
+        family = _PatternFamily([(r"\bi\s+m\b", "I'm")], re.IGNORECASE)
+        family._db = NeverMatches()
+        self.assertFalse(family.may_match("nothing here"))
+        self.assertTrue(family.may_match("it\x1cs fine"))
+        self.assertTrue(family.may_match("ım here"))
+        self.assertEqual(family.apply("ı\x1fm here"), "I'm here")
+
+
 if __name__ == '__main__':
     unittest.main()
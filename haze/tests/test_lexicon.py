@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Tests for the dynamic lexicon (lexicon.py).
+"""
+
+import unittest
+from unittest import mock
+import haze.lexicon as lexicon_mod
+from haze.haze import Vocab
+from haze.cooccur import CooccurField
+from haze.lexicon import Lexicon
+
+
+CORPUS = "the quiet haze drifts over the field"
+
+
+def _make_lexicon(**kwargs) -> Lexicon:
+    vocab = Vocab.from_text(CORPUS)
+    return Lexicon(vocab, CooccurField.from_text(CORPUS, vocab), **kwargs)
+
+
+class TestAbsorption(unittest.TestCase):
+    """Test absorbing words and trigrams."""
+    
+    def test_fractional_boost_leaves_field_untouched(self):
+        """Sub-1 boosts inject nothing, so field probabilities stay valid."""
+        vocab = Vocab.from_text("abc xyz")
+        field = CooccurField.from_text("abc", vocab)
+        lex = Lexicon(vocab, field)
+        
+        record = lex.absorb("zzz yyy xxx", boost=0.5)
+        self.assertEqual(record.trigrams, [("zzz", "yyy", "xxx")])
+        z = vocab.encode("z")[0]
+        self.assertNotIn(z, field.bigram_counts)
+        probs = field.get_bigram_probs(z)
+        self.assertAlmostEqual(probs.sum(), 1.0)
+    
+    def test_boundary_token_cache_is_bounded(self):
+        """The per-word encode cache evicts least recently used words."""
+        lex = _make_lexicon()
+        with mock.patch.object(lexicon_mod, "_ENC_CACHE_SIZE", 2):
+            for word in ("haze", "field", "haze", "quiet"):
+                lex._boundary_tokens(word)
+        self.assertEqual(list(lex._enc_cache), ["haze", "quiet"])
+
+
+class TestWeights(unittest.TestCase):
+    """Test word weight storage and decay."""
+    
+    def assertWeights(self, lex, expected):
+        weights = lex.word_weights
+        self.assertEqual(set(weights), set(expected))
+        for word, weight in expected.items():
+            self.assertAlmostEqual(weights[word], weight)
+    
+    def test_decay_frees_and_reuses_weight_slots(self):
+        """Decayed words leave the lexicon and can be absorbed again."""
+        lex = _make_lexicon(decay_rate=0.5)
+        
+        lex.absorb("haze haze drifts", boost=0.15)
+        lex.absorb("field", boost=1.0)
+        self.assertWeights(lex, {"haze": 0.25, "drifts": 0.15, "field": 1.0})
+        self.assertEqual(lex.get_resonant_words(2), ["field", "haze"])
+        
+        self.assertEqual(lex.decay(), 1)
+        self.assertEqual(set(lex.absorbed_words), {"haze", "field"})
+        
+        record = lex.absorb("drifts quiet", boost=1.5)
+        self.assertEqual(record.words, ["drifts", "quiet"])
+        self.assertAlmostEqual(lex.get_weight("drifts"), 1.5)
+        self.assertEqual(lex.stats().total_words, 4)
+    
+    def test_word_weights_is_read_only(self):
+        """Writes go through set_weight/remove; the mapping rejects them."""
+        lex = _make_lexicon()
+        lex.absorb("haze drifts")
+        
+        with self.assertRaises(TypeError):
+            lex.word_weights["haze"] = 2.0
+        
+        lex.set_weight("haze", 2.0)
+        lex.set_weight("quiet", 0.5)
+        self.assertWeights(lex, {"haze": 2.0, "drifts": 1.0, "quiet": 0.5})
+        
+        self.assertTrue(lex.remove("drifts"))
+        self.assertFalse(lex.remove("drifts"))
+        self.assertEqual(set(lex.absorbed_words), {"haze", "quiet"})
+
+
+if __name__ == '__main__':
+    unittest.main()